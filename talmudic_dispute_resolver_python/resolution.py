@@ -10,50 +10,85 @@ to execute the dispute resolution process. The main function, `apply_the_talmudi
 implements the logic for recursively applying concessions and distributing the remainder until the dispute is resolved.
 
 Functions:
+    configure_logging: Configures the resolution log file when the module is run as a script.
     apply_the_talmudic_principles: Applies Talmudic principles to resolve a given dispute.
     create_dispute: Creates a dispute object from a list of claims.
+    resume_dispute: Rebuilds a dispute object from a checkpoint file.
 """
 
 import logging
+import time
 
 from src.models.dispute_fraction import DisputeFraction as Fraction
 from src.models.talit_claimant import TalitClaimant 
 from src.controllers.claimant_manager import ClaimantManager
 from src.controllers.dispute import Dispute
+from src.controllers.precision import PrecisionPolicy
 from src.models.talit import Talit
 
 
-logging.basicConfig(
-    filename="שלושה_אוחזין_בטלית.log",
-    filemode="a",
-    level=logging.DEBUG,
-    format="%(asctime)s - %(levelname)s - %(module)s - %(message)s",
-)
-
+def configure_logging() -> None:
+    """
+    Logs every step of the resolution process to `שלושה_אוחזין_בטלית.log` in the working directory.
 
-def apply_the_talmudic_principles(dispute: Dispute) -> None:
+    Only called when the module is run as a script, so that importing it has no side effects.
+    """
+    logging.basicConfig(
+        filename="שלושה_אוחזין_בטלית.log",
+        filemode="a",
+        level=logging.DEBUG,
+        format="%(asctime)s - %(levelname)s - %(module)s - %(message)s",
+    )
+
+
+def apply_the_talmudic_principles(
+    dispute: Dispute,
+    checkpoint_path: str = None,
+    checkpoint_rounds: int = None,
+    checkpoint_seconds: float = None,
+) -> None:
     """Applies Talmudic principles to resolve a Talit dispute.
 
     This function iteratively applies concessions and distributes the remainder of the Talit
     until all disputes are resolved. It ensures that the dispute resolution process continues
     until no further concessions are possible, and the Talit's remainder is evenly split.
 
+    When a checkpoint path is given, the state of the dispute is atomically saved to it every
+    `checkpoint_rounds` rounds and/or every `checkpoint_seconds` seconds, so that a long-running
+    resolution can be continued with `resume_dispute` after a restart.
+
     Args:
         dispute (Dispute): The dispute object representing the ongoing Talit dispute.
+        checkpoint_path (str): File to which checkpoints are saved.
+        checkpoint_rounds (int): Number of rounds between checkpoints.
+        checkpoint_seconds (float): Number of seconds between checkpoints.
 
     Returns:
         List[Claimant]: A list of claimants with their final allocations after the dispute is resolved.
+
+    Raises:
+        ValueError: If a checkpoint path is given without `checkpoint_rounds` or `checkpoint_seconds`.
     """
-        
+    if checkpoint_path is not None and not (checkpoint_rounds or checkpoint_seconds):
+        raise ValueError("A checkpoint path requires checkpoint_rounds or checkpoint_seconds.")
+    last_checkpoint = time.monotonic()
+
     while dispute.partial_claimants:
         concession = dispute.partial_claimants[0].concession
         dispute.handle_distribution(concession)
+
+        if checkpoint_path is not None:
+            rounds_due = checkpoint_rounds and dispute.round % checkpoint_rounds == 0
+            seconds_due = checkpoint_seconds and time.monotonic() - last_checkpoint >= checkpoint_seconds
+            if rounds_due or seconds_due:
+                dispute.save_checkpoint(checkpoint_path)
+                last_checkpoint = time.monotonic()
         
     dispute.split_remainder_equally()
     return dispute.full_claimants
 
 
-def create_dispute(claims: list[Fraction]):
+def create_dispute(claims: list[Fraction], precision: PrecisionPolicy = None):
     """
     Creates a dispute object from a list of claims.
 
@@ -63,15 +98,32 @@ def create_dispute(claims: list[Fraction]):
 
     Args:
         claims (list[Fraction]): List of claims on the Talit.
+        precision (PrecisionPolicy): Bit budget of the resolution, and the action taken once it is exceeded.
 
     Returns:
         Dispute: A dispute object representing the ongoing Talit dispute.
     """
     talit = Talit()
     claimant_manager = ClaimantManager(TalitClaimant)
-    dispute = Dispute(talit, claims, claimant_manager)
+    dispute = Dispute(talit, claims, claimant_manager, precision)
     return dispute
 
+def resume_dispute(checkpoint_path: str, precision: PrecisionPolicy = None) -> Dispute:
+    """
+    Rebuilds a dispute object from a checkpoint file.
+
+    Args:
+        checkpoint_path (str): File to which a checkpoint was saved by `apply_the_talmudic_principles`.
+        precision (PrecisionPolicy): Bit budget of the resumed resolution, if any.
+
+    Returns:
+        Dispute: The dispute, ready to be resolved from the round at which the checkpoint was taken.
+    """
+    with open(checkpoint_path, "rb") as file:
+        checkpoint = file.read()
+    return Dispute.from_checkpoint(checkpoint, Talit(), ClaimantManager(TalitClaimant), precision)
+
+
 def print_resolution(resolution: list[TalitClaimant]):
     """
     Prints the resolution of a dispute.
@@ -107,6 +159,7 @@ def resolve_examples():
     
 # Example Usage
 if __name__ == "__main__":
+    configure_logging()
     claims = [
         Fraction(1),
         Fraction(1, 2),
@@ -0,0 +1,73 @@
+"""
+Package: src
+
+Description:
+- The public API of the Talmudic dispute resolver. Importing the package performs no I/O, logging configuration
+  or output, and loads none of the engines: each name below is imported from its submodule on first access.
+
+Engines:
+- Object-oriented pipeline: 'Dispute', 'Talit', 'TalitClaimant' and 'ClaimantManager'.
+- Functional core: 'resolve', returning an immutable 'Resolution', safe to call from many threads.
+- Concession rounds: 'compute_concession_rounds', 'AllocationIndex', 'BatchResolver' and 'resolve_portfolio'.
+- Large disputes: 'resolve_out_of_core' and 'resolve_approximately'.
+- Storage and auditing: the binary claims/results format, and 'verify_allocation'.
+"""
+
+
+_LAZY_ATTRIBUTES = {
+    # Models
+    "DisputeFraction": ".models.dispute_fraction",
+    "validate_claim": ".models.dispute_fraction",
+    "Talit": ".models.talit",
+    "TalitClaimant": ".models.talit_claimant",
+    "AllocationIndex": ".models.allocation_index",
+    # Controllers
+    "ClaimantManager": ".controllers.claimant_manager",
+    "Dispute": ".controllers.dispute",
+    "ConcessionRounds": ".controllers.concession_rounds",
+    "compute_concession_rounds": ".controllers.concession_rounds",
+    "resolve_out_of_core": ".controllers.external_resolution",
+    "QuantileSketch": ".controllers.approximate_resolution",
+    "resolve_approximately": ".controllers.approximate_resolution",
+    "AllocationDiagnosis": ".controllers.verification",
+    "verify_allocation": ".controllers.verification",
+    "verify_allocations": ".controllers.verification",
+    "BatchResolver": ".controllers.batch_resolution",
+    "PortfolioResolution": ".controllers.portfolio_resolution",
+    "Resolution": ".controllers.functional_resolution",
+    "resolve": ".controllers.functional_resolution",
+    "resolve_concurrently": ".controllers.functional_resolution",
+    "PrecisionAction": ".controllers.precision",
+    "PrecisionPolicy": ".controllers.precision",
+    "PrecisionReport": ".controllers.precision",
+    "resolve_portfolio": ".controllers.portfolio_resolution",
+    # Storage
+    "ClaimsReader": ".storage.binary_format",
+    "ResultsReader": ".storage.binary_format",
+    "ResultsWriter": ".storage.binary_format",
+    "write_claims": ".storage.binary_format",
+    "resolve_claims_file": ".storage.binary_format",
+    # Exceptions
+    "FractionError": ".exceptions.fraction_error",
+    "FractionRangeError": ".exceptions.fraction_error",
+    "FractionOperationError": ".exceptions.fraction_error",
+    "FractionPrecisionError": ".exceptions.fraction_error",
+}
+
+__all__ = sorted(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value  # Later accesses bypass this hook.
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
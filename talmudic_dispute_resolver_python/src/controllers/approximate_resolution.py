@@ -0,0 +1,241 @@
+"""
+Module: approximate_resolution.py
+
+Description:
+- This module estimates the resolution of very large disputes by summarising the claims into a fixed number
+  of quantile buckets and resolving the dispute over the buckets, in time depending only on the number of buckets.
+- Every estimate comes with guaranteed bounds on the exact allocation of any claimant in its bucket.
+
+Bounds:
+    Within a given order of claims, an allocation is a linear function of the sorted claims, increasing in the
+    claimant's own claim and decreasing in every other claim. The exact allocation of a claimant in a bucket
+    is therefore bounded below by the dispute in which the claimant holds the bucket's smallest claim and
+    everyone else holds the largest claim of their bucket, and bounded above by the reverse dispute.
+    Since the sketch tracks the exact total of the claims, whether the claims are disputed at all is known exactly.
+
+Classes:
+    ClaimBucket: A range of claims summarised by the sketch.
+    QuantileSketch: Streaming summary of claims into a bounded number of buckets.
+    BucketAllocation: The estimated allocation and its bounds for the claimants of one bucket.
+
+Functions:
+    resolve_approximately: Resolves a dispute over quantile buckets of its claims.
+"""
+
+from bisect import bisect_right
+from dataclasses import dataclass
+from fractions import Fraction
+import heapq
+from typing import Iterable, Union
+
+from ..models.dispute_fraction import validate_claim
+from ..controllers.concession_rounds import grouped_allocations, is_disputed
+
+
+DEFAULT_BUCKET_COUNT = 64
+DEFAULT_MAX_BATCH_SIZE = 2**16
+_MINIMUM_BATCH_SIZE = 1024
+
+
+@dataclass
+class ClaimBucket:
+    """A range of claims summarised by its exact bounds, count and total."""
+
+    lowest: Fraction
+    highest: Fraction
+    count: int
+    total: Fraction
+
+
+@dataclass
+class BucketAllocation:
+    """
+    The estimated allocation of the claimants whose claims fall in one bucket.
+
+    Attributes:
+        lowest_claim (Fraction): The smallest claim in the bucket.
+        highest_claim (Fraction): The largest claim in the bucket.
+        count (int): The number of claimants in the bucket.
+        allocation (Fraction): Estimated allocation, resolved with every bucket at its mean claim.
+        lower_bound (Fraction): No claimant in the bucket collects less than this.
+        upper_bound (Fraction): No claimant in the bucket collects more than this.
+    """
+
+    lowest_claim: Fraction
+    highest_claim: Fraction
+    count: int
+    allocation: Fraction
+    lower_bound: Fraction
+    upper_bound: Fraction
+
+    @property
+    def max_error(self) -> Fraction:
+        """The largest possible difference between the estimate and an exact allocation in the bucket."""
+        return max(self.upper_bound - self.allocation, self.allocation - self.lower_bound)
+
+
+class QuantileSketch:
+    """
+    Streaming summary of claims into approximately equal-count buckets over disjoint claim ranges.
+
+    Each bucket keeps the exact smallest and largest claims, the count and the total of its claims. Claims are
+    buffered in batches; each batch is sorted, claims within a bucket's range join that bucket, and the buckets
+    and remaining claims are cut again into at most `bucket_count` neighbouring groups of roughly equal counts.
+
+    Buckets cannot be split once formed, so batches grow with the number of claims already summarised (up to
+    `max_batch_size`): the boundaries are drawn from a large share of the claims, and memory stays bounded by
+    `bucket_count + max_batch_size`. Claims arriving in sorted order still fill the buckets unevenly, which
+    widens the error bounds but never invalidates them.
+
+    Methods:
+        add(claim: Fraction) -> None: Adds a single claim to the sketch.
+        update(claims: Iterable[Fraction]) -> None: Adds a stream of claims to the sketch.
+        buckets() -> list: The buckets, from the largest claims to the smallest.
+    """
+
+    def __init__(self, bucket_count: int = DEFAULT_BUCKET_COUNT, max_batch_size: int = DEFAULT_MAX_BATCH_SIZE) -> None:
+        if bucket_count < 1:
+            raise ValueError(f"A sketch needs at least one bucket, got {bucket_count}.")
+        self.bucket_count = bucket_count
+        self.max_batch_size = max_batch_size
+        self.claimant_count = 0
+        self.total = Fraction(0)
+        self._buckets: list[ClaimBucket] = []
+        self._lowest: list[Fraction] = []  # The smallest claim of each bucket, in ascending order.
+        self._pending: list[Fraction] = []
+
+    def add(self, claim: Fraction) -> None:
+        claim = validate_claim(claim)
+        claim = Fraction(claim.numerator, claim.denominator)
+        self.claimant_count += 1
+        self.total += claim
+        self._pending.append(claim)
+        summarised = self.claimant_count - len(self._pending)
+        if len(self._pending) >= min(self.max_batch_size, max(_MINIMUM_BATCH_SIZE, summarised)):
+            self._flush()
+
+    def update(self, claims: Iterable[Fraction]) -> None:
+        for claim in claims:
+            self.add(claim)
+
+    def _flush(self) -> None:
+        """Adds the pending claims to the buckets, and cuts them back into at most `bucket_count` buckets."""
+        if not self._pending:
+            return
+        buckets = [ClaimBucket(bucket.lowest, bucket.highest, bucket.count, bucket.total) for bucket in self._buckets]
+        singletons = []
+        for claim in sorted(self._pending):
+            position = bisect_right(self._lowest, claim) - 1
+            if position >= 0 and claim <= buckets[position].highest:
+                buckets[position].count += 1
+                buckets[position].total += claim
+            else:
+                singletons.append(ClaimBucket(claim, claim, 1, claim))
+        self._pending = []
+
+        self._buckets = list(heapq.merge(buckets, singletons, key=lambda bucket: bucket.lowest))
+        self._compress()
+
+    def _compress(self) -> None:
+        """Cuts the buckets into at most `bucket_count` groups of neighbouring buckets of roughly equal counts."""
+        merged, remaining = [], self.claimant_count
+        current = self._buckets[0]
+        for bucket in self._buckets[1:]:
+            # Each group aims at an equal share of the claims not yet placed into the groups still available,
+            # and takes the next bucket if that brings it closer to its target than it is now.
+            target = remaining / max(1, self.bucket_count - len(merged))
+            if current.count + bucket.count - target < target - current.count:
+                current = self._merge(current, bucket)
+            else:
+                merged.append(current)
+                remaining -= current.count
+                current = bucket
+        merged.append(current)
+
+        # Oversized buckets can leave too many groups; merge the smallest neighbours until the count is met.
+        while len(merged) > self.bucket_count:
+            position = min(range(len(merged) - 1), key=lambda index: merged[index].count + merged[index + 1].count)
+            merged[position : position + 2] = [self._merge(merged[position], merged[position + 1])]
+
+        self._buckets = merged
+        self._lowest = [bucket.lowest for bucket in merged]
+
+    @staticmethod
+    def _merge(lower: ClaimBucket, upper: ClaimBucket) -> ClaimBucket:
+        return ClaimBucket(lower.lowest, upper.highest, lower.count + upper.count, lower.total + upper.total)
+
+    def buckets(self) -> list[ClaimBucket]:
+        self._flush()
+        return self._buckets[::-1]
+
+
+def _own_allocation(claims: list[Fraction], counts: list[int], group: int) -> Fraction:
+    present = [index for index, count in enumerate(counts) if count]
+    allocations = grouped_allocations([claims[index] for index in present], [counts[index] for index in present])
+    return allocations[present.index(group)]
+
+
+def _bounds(buckets: list[ClaimBucket], index: int) -> tuple[Fraction, Fraction]:
+    """Resolves the worst and best disputes for a claimant of a bucket, with the buckets sorted from largest."""
+    own = buckets[index]
+    highest = [bucket.highest for bucket in buckets]
+    lowest = [bucket.lowest for bucket in buckets]
+    counts = [bucket.count for bucket in buckets]
+    others = counts[:index] + [own.count - 1] + counts[index + 1 :]
+
+    # The claimant holds the bucket's smallest claim while every other claimant holds their bucket's largest.
+    lower_bound = _own_allocation(
+        highest[: index + 1] + [own.lowest] + highest[index + 1 :],
+        others[: index + 1] + [1] + others[index + 1 :],
+        index + 1,
+    )
+    # The claimant holds the bucket's largest claim while every other claimant holds their bucket's smallest.
+    upper_bound = _own_allocation(
+        lowest[:index] + [own.highest] + lowest[index:],
+        others[:index] + [1] + others[index:],
+        index,
+    )
+    return lower_bound, upper_bound
+
+
+def resolve_approximately(
+    claims: Union[Iterable[Fraction], QuantileSketch], bucket_count: int = DEFAULT_BUCKET_COUNT
+) -> list[BucketAllocation]:
+    """
+    Estimates the resolution of a dispute from quantile buckets of its claims.
+
+    Resolving over `k` buckets takes O(k^2) time regardless of the number of claimants, so `bucket_count`
+    trades the width of the error bounds for latency.
+
+    Args:
+        claims (Union[Iterable[Fraction], QuantileSketch]): The claims of the dispute, or a sketch already fed with them.
+        bucket_count (int): The number of buckets to summarise the claims into, when claims are given.
+
+    Returns:
+        list[BucketAllocation]: The estimated allocation and bounds of every bucket, from the largest claims
+        to the smallest.
+    """
+    sketch = claims
+    if not isinstance(sketch, QuantileSketch):
+        sketch = QuantileSketch(bucket_count)
+        sketch.update(claims)
+    buckets = sketch.buckets()
+
+    if not is_disputed([sketch.total]) or sketch.claimant_count < 2:
+        return [
+            BucketAllocation(
+                bucket.lowest, bucket.highest, bucket.count, bucket.total / bucket.count, bucket.lowest, bucket.highest
+            )
+            for bucket in buckets
+        ]
+
+    estimates = grouped_allocations(
+        [bucket.total / bucket.count for bucket in buckets], [bucket.count for bucket in buckets]
+    )
+    resolution = []
+    for index, (bucket, estimate) in enumerate(zip(buckets, estimates)):
+        lower_bound, upper_bound = _bounds(buckets, index)
+        resolution.append(
+            BucketAllocation(bucket.lowest, bucket.highest, bucket.count, estimate, lower_bound, upper_bound)
+        )
+    return resolution
@@ -0,0 +1,169 @@
+"""
+Module: batch_resolution.py
+
+Description:
+- This module resolves batches of disputes that share their largest claims, as is typical of disputes generated
+  from templates. The shares of each concession round only depend on the number of claimants and on the sorted
+  claims up to that round, so the sorted claims of every dispute are inserted into a trie (one per claimant count)
+  whose nodes hold the running sums of the partial and full shares. Disputes sharing a prefix of sorted claims
+  compute the rounds of that prefix only once. The trie holds at most `max_nodes` rounds: once a dispute would
+  exceed the cap, the trie is discarded and rebuilt from the following disputes, and a dispute with more claims
+  than the cap is resolved without the trie.
+
+Classes:
+    TrieStatistics: Counters describing how much of the round computation was served from the trie.
+    BatchResolver: Resolves disputes through the shared trie of concession rounds.
+"""
+
+from dataclasses import dataclass, field
+from fractions import Fraction
+from typing import Iterable, Sequence
+
+from ..models.dispute_fraction import validate_claim
+from ..controllers.concession_rounds import add_round_shares, is_disputed, iter_round_shares, remainder_share
+
+
+DEFAULT_MAX_NODES = 1_000_000
+
+@dataclass
+class _RoundNode:
+    partial_total: Fraction
+    full_total: Fraction
+    children: dict = field(default_factory=dict)
+
+
+@dataclass
+class TrieStatistics:
+    """
+    Counters of the round computations of a 'BatchResolver'.
+
+    Attributes:
+        disputes (int): Number of disputes resolved.
+        undisputed (int): Number of disputes whose claims were granted in full, without computing any round.
+        rounds_computed (int): Number of concession rounds computed and stored in the trie.
+        rounds_reused (int): Number of concession rounds served from a node computed for an earlier dispute.
+        evictions (int): Number of times the trie was discarded for reaching its node cap.
+    """
+
+    disputes: int = 0
+    undisputed: int = 0
+    rounds_computed: int = 0
+    rounds_reused: int = 0
+    evictions: int = 0
+
+    @property
+    def reuse_ratio(self) -> float:
+        """The fraction of all rounds that were served from the trie."""
+        rounds = self.rounds_computed + self.rounds_reused
+        return self.rounds_reused / rounds if rounds else 0.0
+
+
+class BatchResolver:
+    """
+    Resolves disputes through a trie of concession rounds shared between disputes.
+
+    The trie persists between calls, so disputes resolved later reuse the rounds of earlier ones; `clear`
+    releases it. The trie is discarded whenever resolving a dispute could grow it beyond `max_nodes` rounds,
+    which bounds its memory on long streams of unrelated disputes; disputes with more claims than `max_nodes`
+    are resolved without it.
+
+    Attributes:
+        max_nodes (int): The maximum number of rounds kept in the trie.
+        node_count (int): The number of rounds currently kept in the trie.
+        statistics (TrieStatistics): Counters of the computed and reused rounds.
+
+    Methods:
+        resolve(claims: Sequence[Fraction]) -> list[Fraction]: Resolves a single dispute.
+        resolve_batch(disputes: Iterable[Sequence[Fraction]]) -> list[list[Fraction]]: Resolves a batch of disputes.
+        clear() -> None: Discards the trie and resets the statistics.
+    """
+
+    def __init__(self, max_nodes: int = DEFAULT_MAX_NODES) -> None:
+        if max_nodes < 1:
+            raise ValueError(f"The trie needs room for at least one round, got {max_nodes}.")
+        self.max_nodes = max_nodes
+        self.node_count = 0
+        self._roots: dict[int, _RoundNode] = {}
+        self.statistics = TrieStatistics()
+
+    def clear(self) -> None:
+        self._roots.clear()
+        self.node_count = 0
+        self.statistics = TrieStatistics()
+
+    def _stored_rounds(self, claims: list[Fraction]) -> int:
+        """Returns the number of leading rounds of the sorted claims already stored in the trie."""
+        node = self._roots.get(len(claims))
+        for stored, claim in enumerate(claims):
+            node = node and node.children.get(claim)
+            if node is None:
+                return stored
+        return len(claims)
+
+    def _round_sums(self, claims: list[Fraction]) -> list[tuple[Fraction, Fraction]]:
+        """
+        Returns the running sums of the partial and full shares of every round of a disputed set of sorted claims,
+        computing the rounds missing from the trie.
+        """
+        claimant_count = len(claims)
+        if claimant_count > self.max_nodes:
+            self.statistics.rounds_computed += claimant_count
+            return list(iter_round_shares(claims, claimant_count))
+
+        if self.node_count + claimant_count - self._stored_rounds(claims) > self.max_nodes:
+            self._roots.clear()
+            self.node_count = 0
+            self.statistics.evictions += 1
+
+        node = self._roots.setdefault(claimant_count, _RoundNode(Fraction(0), Fraction(0)))
+        previous_claim, sums = Fraction(1), []
+        for index, claim in enumerate(claims):
+            child = node.children.get(claim)
+            if child is None:
+                concession = previous_claim - claim
+                child = _RoundNode(
+                    *add_round_shares(node.partial_total, node.full_total, concession, index, claimant_count)
+                )
+                node.children[claim] = child
+                self.node_count += 1
+                self.statistics.rounds_computed += 1
+            else:
+                self.statistics.rounds_reused += 1
+            sums.append((child.partial_total, child.full_total))
+            node, previous_claim = child, claim
+        return sums
+
+    def resolve(self, claims: Sequence[Fraction]) -> list[Fraction]:
+        """
+        Resolves a single dispute.
+
+        Args:
+            claims (Sequence[Fraction]): The claims of the dispute, in any order.
+
+        Returns:
+            list[Fraction]: The allocation of each claim, in the same order as the claims.
+
+        Raises:
+            TypeError: If a claim cannot be converted to a DisputeFraction.
+            FractionRangeError: If a claim is not within the range [0, 1].
+        """
+        claims = [Fraction(validate_claim(claim)) for claim in claims]
+        self.statistics.disputes += 1
+
+        if not is_disputed(claims):
+            self.statistics.undisputed += 1
+            return claims
+
+        order = sorted(range(len(claims)), key=claims.__getitem__, reverse=True)
+        sorted_claims = [claims[index] for index in order]
+        round_sums = self._round_sums(sorted_claims)
+        full_total = round_sums[-1][1]
+        share_of_remainder = remainder_share(len(claims), sorted_claims[-1])
+
+        allocations = [Fraction(0)] * len(claims)
+        for index, (partial_shares, full_shares) in zip(order, round_sums):
+            allocations[index] = full_total - full_shares + partial_shares + share_of_remainder
+        return allocations
+
+    def resolve_batch(self, disputes: Iterable[Sequence[Fraction]]) -> list[list[Fraction]]:
+        return [self.resolve(claims) for claims in disputes]
@@ -0,0 +1,227 @@
+"""
+Module: concession_rounds.py
+
+Description:
+- This module computes the concession rounds of the Talmudic dispute algorithm once, as prefix sums of the
+  partial and full shares distributed in each round (mirroring `distribute_based_on_concessions` in the core algorithm).
+- Once the rounds are computed, the allocation of any claimant is available in constant time from its sorted position,
+  without creating or mutating claimant objects.
+
+Classes:
+    ConcessionRounds: Prefix arrays of the per-round shares of a single dispute.
+
+Functions:
+    is_disputed: Whether a set of claims is disputed, i.e. cannot all be granted in full.
+    add_round_shares: Adds the shares of a single concession round to the running sums.
+    iter_round_shares: Streams the running per-round shares of claims that are already sorted.
+    remainder_share: Computes the share of the undistributed remainder collected by every claimant.
+    grouped_allocations: Computes the allocations of a dispute given as distinct claims and their multiplicities.
+    compute_concession_rounds: Sorts the claims and computes the concession rounds of the dispute.
+
+Note:
+- Intermediate values are kept as plain 'fractions.Fraction' objects, since the running remainder of a dispute
+  may temporarily leave the range enforced by 'DisputeFraction'. Claims are validated on entry.
+"""
+
+from dataclasses import dataclass
+from fractions import Fraction
+from typing import Iterable, Iterator
+
+from ..models.dispute_fraction import validate_claim
+
+
+@dataclass
+class ConcessionRounds:
+    """
+    Prefix arrays of the shares distributed in the concession rounds of a dispute.
+
+    Round `i` resolves the concession of the claim at sorted position `i`; the claimant at that position
+    collects the partial shares of rounds 0..i and the full shares of every later round.
+
+    Attributes:
+        claims (list[Fraction]): The claims, sorted from largest to smallest.
+        partial_shares (list[Fraction]): Sum of the partial shares of rounds 0..i, at index i.
+        full_shares (list[Fraction]): Sum of the full shares of rounds 0..i, at index i.
+        remainder_share (Fraction): Share of the undistributed remainder collected by every claimant.
+        disputed (bool): False when the claims sum to at most 1, in which case every claim is granted in full.
+    """
+
+    claims: list[Fraction]
+    partial_shares: list[Fraction]
+    full_shares: list[Fraction]
+    remainder_share: Fraction
+    disputed: bool
+
+    def allocation(self, position: int) -> Fraction:
+        """
+        Returns the final allocation of the claimant at a sorted position.
+
+        Args:
+            position (int): Index of the claim in the sorted (descending) claims.
+
+        Returns:
+            Fraction: The fraction of the resource collected by the claimant.
+        """
+        if not self.disputed:
+            return self.claims[position]
+        later_full_shares = self.full_shares[-1] - self.full_shares[position]
+        return later_full_shares + self.partial_shares[position] + self.remainder_share
+
+    def allocations(self) -> list[Fraction]:
+        """Returns the final allocations of all claimants, in sorted order."""
+        return [self.allocation(position) for position in range(len(self.claims))]
+
+
+def is_disputed(claims: Iterable[Fraction]) -> bool:
+    """
+    Returns whether a set of claims is disputed. There is no dispute if every claim can be granted in full,
+    i.e. if the claims sum to at most 1.
+
+    Args:
+        claims (Iterable[Fraction]): The claims, in any order; a running total of streamed claims may stand in.
+    """
+    # Summed as plain fractions: the total of a dispute leaves the range enforced by 'DisputeFraction'.
+    return sum(map(Fraction, claims)) > 1
+
+
+def add_round_shares(
+    partial_total: Fraction, full_total: Fraction, concession: Fraction, claims_before: int, claimant_count: int
+) -> tuple[Fraction, Fraction]:
+    """
+    Adds the shares of a single concession round to the running sums of the partial and full shares.
+
+    The round resolves `concession`, the gap between the claim at sorted position `claims_before` and the claim
+    before it: every other claimant's share of it is split between the `claims_before + 1` partial claimants,
+    while full claimants collect their share and the partial shares of all the claimants not yet full.
+
+    Args:
+        partial_total (Fraction): Sum of the partial shares of the earlier rounds.
+        full_total (Fraction): Sum of the full shares of the earlier rounds.
+        concession (Fraction): The concession resolved in this round.
+        claims_before (int): Number of claims larger than the claim resolved in this round.
+        claimant_count (int): Total number of claims, which must be at least 2.
+
+    Returns:
+        tuple[Fraction, Fraction]: The sums of the partial and full shares, including this round.
+    """
+    per_claim_share = concession / (claimant_count - 1)  # Excludes the conceding party from their own concession.
+    partial_share = per_claim_share / (claims_before + 1)
+    return (
+        partial_total + partial_share,
+        full_total + per_claim_share + (claimant_count - claims_before) * partial_share,
+    )
+
+
+def iter_round_shares(
+    claims: Iterable[Fraction], claimant_count: int
+) -> Iterator[tuple[Fraction, Fraction]]:
+    """
+    Streams the concession rounds of a disputed set of claims.
+
+    For each claim, resolves the remaining concession between the partial and full claimants at that point,
+    and yields the running sums of the partial and full shares distributed so far.
+
+    Args:
+        claims (Iterable[Fraction]): The claims, sorted from largest to smallest.
+        claimant_count (int): Total number of claims, which must be at least 2.
+
+    Yields:
+        tuple[Fraction, Fraction]: The sums of the partial and full shares of rounds 0..i.
+    """
+    previous_claim = Fraction(1)
+    partial_total, full_total = Fraction(0), Fraction(0)
+
+    for index, claim in enumerate(claims):
+        # Every earlier round resolved the concession up to the previous claim's.
+        partial_total, full_total = add_round_shares(
+            partial_total, full_total, previous_claim - claim, index, claimant_count
+        )
+        previous_claim = claim
+        yield partial_total, full_total
+
+
+def remainder_share(claimant_count: int, smallest_claim: Fraction) -> Fraction:
+    """
+    Computes the share of the undistributed remainder collected by every claimant of a dispute.
+
+    The rounds resolve every concession up to the smallest claim's, and their cumulative allocations
+    add up to `n / (n - 1)` of the resolved concessions.
+
+    Args:
+        claimant_count (int): Total number of claims, which must be at least 2.
+        smallest_claim (Fraction): The smallest claim of the dispute.
+    """
+    resolved_concessions = 1 - smallest_claim
+    remainder = 1 - claimant_count * resolved_concessions / (claimant_count - 1)
+    return remainder / claimant_count
+
+
+def grouped_allocations(claims: list[Fraction], counts: list[int]) -> list[Fraction]:
+    """
+    Computes the allocations of a disputed set of claims given as groups of equal claims.
+
+    Equal claims collect equal allocations, and only the first claim of each group resolves a non-zero concession,
+    so the rounds are computed once per group rather than once per claimant.
+
+    Args:
+        claims (list[Fraction]): The claim of each group, sorted from largest to smallest.
+        counts (list[int]): The number of claimants in each group; every count must be positive.
+
+    Returns:
+        list[Fraction]: The allocation collected by each claimant of each group. The claims are assumed to be
+        disputed (i.e. to sum to more than 1), and must total at least 2 claimants.
+    """
+    claimant_count = sum(counts)
+    previous_claim, claims_before = Fraction(1), 0
+    partial_total, full_total = Fraction(0), Fraction(0)
+    partial_shares, full_shares = [], []
+
+    for claim, count in zip(claims, counts):
+        partial_total, full_total = add_round_shares(
+            partial_total, full_total, previous_claim - claim, claims_before, claimant_count
+        )
+        partial_shares.append(partial_total)
+        full_shares.append(full_total)
+        previous_claim, claims_before = claim, claims_before + count
+
+    share_of_remainder = remainder_share(claimant_count, claims[-1])
+    return [
+        full_total - full_shares[group] + partial_shares[group] + share_of_remainder
+        for group in range(len(claims))
+    ]
+
+
+def compute_concession_rounds(claims: list) -> ConcessionRounds:
+    """
+    Computes the concession rounds of a dispute.
+
+    Sorts the claims from largest to smallest and, for each claim, resolves the remaining concession
+    between the partial and full claimants at that point, accumulating the per-round shares as prefix sums.
+
+    Args:
+        claims (list): Claims on the resource; each is validated with `validate_claim`.
+
+    Returns:
+        ConcessionRounds: The sorted claims and the prefix arrays of the per-round shares.
+
+    Raises:
+        TypeError: If a claim cannot be converted to a DisputeFraction.
+        FractionRangeError: If a claim is not within the range [0, 1].
+    """
+    claims = sorted(
+        (Fraction(claim.numerator, claim.denominator) for claim in map(validate_claim, claims)),
+        reverse=True,
+    )
+    claimant_count = len(claims)
+
+    if not is_disputed(claims):
+        return ConcessionRounds(claims, [], [], Fraction(0), False)
+
+    partial_shares, full_shares = [], []
+    for partial_total, full_total in iter_round_shares(claims, claimant_count):
+        partial_shares.append(partial_total)
+        full_shares.append(full_total)
+
+    return ConcessionRounds(
+        claims, partial_shares, full_shares, remainder_share(claimant_count, claims[-1]), True
+    )
@@ -19,15 +19,32 @@ Note:
 """
 
 import logging
+import os
+import tempfile
 from dataclasses import dataclass
 from ..models.dispute_fraction import DisputeFraction as Fraction
 from ..base.disputed_resource import DisputedResource
 from ..controllers.claimant_manager import ClaimantManager
+from ..controllers.concession_rounds import is_disputed
+from ..controllers.precision import (
+    PrecisionAction,
+    PrecisionPolicy,
+    PrecisionReport,
+    bit_length,
+    decimal_allocations,
+    scaled_allocations,
+)
+from ..exceptions.fraction_error import FractionPrecisionError
+from ..storage.varint import read_varint, write_varint
 
 
 logger = logging.getLogger(__name__)
 
 
+CHECKPOINT_MAGIC = b"TDCK"
+CHECKPOINT_VERSION = 3
+
+
 @dataclass
 class Distribution:
     concession: Fraction
@@ -52,6 +69,9 @@ class Dispute:
         full_claimants (list[Claimant]): List of claimants with full claims.
         partial_claimants (list[Claimant]): List of claimants with partial claims.
         claimant_count (int): Total number of claimants.
+        round (int): Number of concession rounds distributed so far.
+        precision (PrecisionPolicy): Bit budget of the claimants' collected fractions, if any.
+        precision_report (PrecisionReport): The largest bit length seen under the policy, and the fallback used if any.
 
     Methods:
         __init__: Initializes the DisputeManager with the Talit object and ClaimantManager.
@@ -60,21 +80,33 @@ class Dispute:
         calculate_allocation_for_claimant_groups: Calculates Talit fractions for full and partial claimants.
         calculate_allocations: Determines distributions for full and partial claimants, including total distribution.
         distribute_lowest_concession: Manages the distribution of concessions among claimants in a single cycle.
+        enforce_precision: Applies the precision policy to the fractions collected so far.
+        checkpoint / from_checkpoint: Packs the state of the dispute, and rebuilds a dispute from it.
+        save_checkpoint: Atomically writes a checkpoint to a file.
     """
 
     def __init__(
-        self, talit: DisputedResource, claims: list[Fraction], claimant_manager: ClaimantManager
+        self,
+        talit: DisputedResource,
+        claims: list[Fraction],
+        claimant_manager: ClaimantManager,
+        precision: PrecisionPolicy = None,
     ) -> None:
         """Initializes the DisputeManager with a Talit object and a ClaimantManager.
 
         Args:
             talit (Talit): The Talit object representing the disputed item.
             claimant_manager (ClaimantManager): Manager responsible for creating and handling claimants.
+            precision (PrecisionPolicy): Bit budget of the collected fractions, and the action taken once it is
+                exceeded. Without a policy, the dispute is always resolved exactly.
         """
         self.talit = talit
         self.claimant_manager = claimant_manager
         
         self.claimant_count = len(claims)
+        self.round = 0
+        self.precision = precision
+        self.precision_report = PrecisionReport(PrecisionAction.EXACT, max(map(bit_length, claims), default=0))
         self.partial_claimants = self.claimant_manager.create_claimants(sorted(claims, reverse=True))
         self.full_claimants = []
         
@@ -110,5 +142,162 @@ class Dispute:
         self.talit.allocate(distribution.full_share * self.claimant_count)
         self.distribute_concession(distribution)
         self.update_claimant_statuses()
+        self.round += 1
+        self.enforce_precision()
+
+    def enforce_precision(self) -> None:
+        """Applies the precision policy to the fractions collected after the latest round.
+
+        The collected fractions are the running sums of every round's shares, so their denominators grow with
+        the least common multiple of the claims' denominators. Once one exceeds the policy's bit budget, RAISE
+        raises with the dispute left consistent at the end of the round, so it can still be checkpointed.
+        SCALED_INTEGER and DECIMAL resolve the claims again in bounded-precision arithmetic, as 'resolve' does,
+        grant every claimant their allocation and conclude the dispute, reporting the bound on the error.
+
+        Without a policy, nothing is measured and the report keeps the bit length of the claims.
+
+        Raises:
+            FractionPrecisionError: If the budget is exceeded and the policy's action is RAISE.
+        """
+        if self.precision is None:
+            return
+        claimants = self.full_claimants + self.partial_claimants
+        max_bits = max(bit_length(claimant.collected) for claimant in claimants)
+        if max_bits > self.precision_report.max_bits:
+            self.precision_report = PrecisionReport(PrecisionAction.EXACT, max_bits)
+        if max_bits <= self.precision.bit_budget:
+            return
+
+        largest = max((claimant.collected for claimant in claimants), key=bit_length)
+        if self.precision.action is PrecisionAction.RAISE:
+            raise FractionPrecisionError(largest, self.precision.bit_budget, self.round)
+
+        claimants.sort(key=lambda claimant: claimant.claim, reverse=True)
+        claims = [claimant.claim for claimant in claimants]
+        if not is_disputed(claims):
+            allocations, error_bound = claims, Fraction(0)
+        elif self.precision.action is PrecisionAction.SCALED_INTEGER:
+            allocations, error_bound = scaled_allocations(claims, self.precision.scaled_bits)
+        else:
+            allocations, error_bound = decimal_allocations(claims, self.precision.decimal_digits)
+
+        for claimant, allocation in zip(claimants, allocations):
+            # The exact allocation lies within [0, claim], so clamping never moves away from it.
+            allocation = min(max(allocation, 0), claimant.claim)
+            claimant.collected = Fraction(allocation.numerator, allocation.denominator)
+            claimant.concession = Fraction(0)
+        self.full_claimants, self.partial_claimants = claimants, []
+        self.talit.remainder = Fraction(0)
+
+        self.precision_report = PrecisionReport(self.precision.action, max_bits, self.round, error_bound)
+        logger.warning(
+            "Precision budget of %s bits exceeded in round %s; resolved in %s arithmetic.",
+            self.precision.bit_budget,
+            self.round,
+            self.precision.action.value,
+        )
+
+    def checkpoint(self) -> bytes:
+        """Packs the state of the dispute into a compact checkpoint.
+
+        Full claimants always hold the largest claims, so the claimants are packed in sorted order, with the
+        number of full claimants marking the partial/full boundary. The header also keeps the largest bit length
+        seen so far, so that a resumed dispute reports its peak precision across the restart.
+
+        The remainder, and each claimant's claim, collected fraction and concession, are packed as a varint
+        numerator and denominator each: a common denominator would grow with the least common multiple of every
+        denominator and scale up every numerator.
+
+        Returns:
+            bytes: The checkpoint, restored with `from_checkpoint`.
+        """
+        claimants = self.full_claimants + self.partial_claimants
+        values = [self.talit.remainder]
+        for claimant in claimants:
+            values.extend((claimant.claim, claimant.collected, claimant.concession))
+
+        packed = bytearray(CHECKPOINT_MAGIC)
+        header = (
+            CHECKPOINT_VERSION,
+            self.round,
+            self.claimant_count,
+            len(self.full_claimants),
+            self.precision_report.max_bits,
+        )
+        for number in header:
+            packed += write_varint(number)
+        for value in values:
+            packed += write_varint(value.numerator) + write_varint(value.denominator)
+        return bytes(packed)
+
+    @classmethod
+    def from_checkpoint(
+        cls,
+        checkpoint: bytes,
+        talit: DisputedResource,
+        claimant_manager: ClaimantManager,
+        precision: PrecisionPolicy = None,
+    ) -> "Dispute":
+        """Rebuilds a dispute from a checkpoint, ready to resume from the round at which it was taken.
+
+        Args:
+            checkpoint (bytes): A checkpoint produced by `checkpoint`.
+            talit (DisputedResource): A fresh disputed object, whose remainder is restored.
+            claimant_manager (ClaimantManager): Manager responsible for creating and handling claimants.
+            precision (PrecisionPolicy): Bit budget of the resumed dispute, if any.
+
+        Raises:
+            ValueError: If the data is not a checkpoint of a supported version.
+        """
+        if checkpoint[: len(CHECKPOINT_MAGIC)] != CHECKPOINT_MAGIC:
+            raise ValueError("Data is not a dispute checkpoint.")
+        position, header = len(CHECKPOINT_MAGIC), []
+        version, position = read_varint(checkpoint, position)
+        if version != CHECKPOINT_VERSION:
+            raise ValueError(f"Unsupported checkpoint version: {version}")
+        for _ in range(4):
+            number, position = read_varint(checkpoint, position)
+            header.append(number)
+        round, claimant_count, fulls_count, max_bits = header
+
+        values = []
+        for _ in range(1 + 3 * claimant_count):
+            numerator, position = read_varint(checkpoint, position)
+            denominator, position = read_varint(checkpoint, position)
+            values.append(Fraction(numerator, denominator))
+
+        dispute = cls(talit, values[1::3], claimant_manager, precision)
+        claimants = dispute.full_claimants + dispute.partial_claimants
+        for claimant, collected, concession in zip(claimants, values[2::3], values[3::3]):
+            claimant.collected = collected
+            claimant.concession = concession
+        dispute.full_claimants = claimants[:fulls_count]
+        dispute.partial_claimants = claimants[fulls_count:]
+        dispute.talit.remainder = values[0]
+        dispute.round = round
+        max_bits = max(max_bits, dispute.precision_report.max_bits)
+        dispute.precision_report = PrecisionReport(PrecisionAction.EXACT, max_bits)
+
+        logger.info("Dispute restored from checkpoint at round %s.", round)
+        return dispute
+
+    def save_checkpoint(self, path: str) -> None:
+        """Atomically writes a checkpoint of the dispute, so that `path` always holds a complete checkpoint.
+
+        Args:
+            path (str): Destination file path.
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        with tempfile.NamedTemporaryFile(dir=directory, prefix=".checkpoint-", delete=False) as file:
+            try:
+                file.write(self.checkpoint())
+                file.flush()
+                os.fsync(file.fileno())
+            except BaseException:
+                file.close()
+                os.remove(file.name)
+                raise
+        os.replace(file.name, path)
+        logger.info("Checkpoint of round %s saved to %s.", self.round, path)
 
         
\ No newline at end of file
@@ -0,0 +1,197 @@
+"""
+Module: external_resolution.py
+
+Description:
+- This module resolves a single dispute whose claims do not fit in memory, using a bounded memory budget:
+    1. The claims are read in chunks, each chunk is sorted and spilled to a temporary run file.
+    2. The runs are merged (in several passes if there are many of them). The final merge streams the sorted
+       claims through the concession rounds, spilling the running sums of the partial and full shares of every
+       round, and ending with the totals of the whole dispute.
+    3. A second streaming pass over the spilled running sums writes every claimant's allocation to a results file.
+
+Functions:
+    resolve_out_of_core: Resolves a dispute from an iterable of claims into a results file.
+
+Note:
+- Allocations are written in descending order of claims, so the allocation at position i belongs to the claimant
+  that 'ClaimantManager' would identify as str(i + 1).
+"""
+
+from fractions import Fraction
+import heapq
+import logging
+import os
+import tempfile
+from typing import Iterable, Iterator, Optional
+
+from ..models.dispute_fraction import validate_claim
+from ..controllers.concession_rounds import is_disputed, iter_round_shares, remainder_share
+from ..storage.binary_format import ResultsWriter
+from ..storage.varint import read_varint, write_varint
+
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_MEMORY_BUDGET = 64 * 2**20
+# Rough footprint of a single claim held in memory as a Fraction in a list.
+_CLAIM_FOOTPRINT = 256
+_MAX_MERGE_FAN_IN = 64
+_MIN_BLOCK_SIZE = 2**12
+_MAX_BLOCK_SIZE = 2**20
+
+
+def _block_size(memory_budget: int) -> int:
+    """The size of the read and write buffers of each run, so that a full merge stays within the memory budget."""
+    # Every run being merged holds a read buffer, and the merged output a write buffer.
+    return max(_MIN_BLOCK_SIZE, min(_MAX_BLOCK_SIZE, memory_budget // (_MAX_MERGE_FAN_IN + 1)))
+
+
+def _write_run(path: str, claims: Iterable[Fraction], block_size: int) -> None:
+    with open(path, "wb", buffering=block_size) as file:
+        for claim in claims:
+            file.write(write_varint(claim.numerator) + write_varint(claim.denominator))
+
+
+def _read_run(path: str, block_size: int) -> Iterator[Fraction]:
+    buffer = bytearray()
+    with open(path, "rb", buffering=0) as file:
+        while block := file.read(block_size):
+            buffer += block
+            position = 0
+            while True:
+                try:
+                    numerator, following = read_varint(buffer, position)
+                    denominator, following = read_varint(buffer, following)
+                except IndexError:
+                    break  # The record continues in the next block.
+                yield Fraction(numerator, denominator)
+                position = following
+            del buffer[:position]
+    if buffer:
+        raise ValueError(f"Truncated run file: {path}")
+
+
+def _write_rounds(
+    path: str, claims: Iterable[Fraction], claimant_count: int, block_size: int
+) -> tuple[Fraction, Fraction]:
+    """Spills the running sums of the partial and full shares of every round, and returns their totals."""
+    partial_total = full_total = Fraction(0)
+    with open(path, "wb", buffering=block_size) as file:
+        for partial_total, full_total in iter_round_shares(claims, claimant_count):
+            for share in (partial_total, full_total):
+                file.write(write_varint(share.numerator) + write_varint(share.denominator))
+    return partial_total, full_total
+
+
+class _RunSpiller:
+    """Spills sorted runs of claims to numbered files in a spill directory."""
+
+    def __init__(self, directory: str, block_size: int) -> None:
+        self.directory = directory
+        self.block_size = block_size
+        self.spilled = 0
+
+    def next_path(self) -> str:
+        path = os.path.join(self.directory, f"run-{self.spilled}.bin")
+        self.spilled += 1
+        return path
+
+    def spill(self, claims: Iterable[Fraction]) -> str:
+        path = self.next_path()
+        _write_run(path, claims, self.block_size)
+        return path
+
+    def read(self, path: str) -> Iterator[Fraction]:
+        return _read_run(path, self.block_size)
+
+
+def _sort_into_runs(
+    claims: Iterable, chunk_size: int, spiller: _RunSpiller
+) -> tuple[list[str], int, Fraction, Fraction]:
+    runs, chunk = [], []
+    claimant_count, total, smallest_claim = 0, Fraction(0), Fraction(1)
+
+    for claim in claims:
+        claim = validate_claim(claim)
+        claim = Fraction(claim.numerator, claim.denominator)
+        chunk.append(claim)
+        claimant_count += 1
+        total += claim
+        smallest_claim = min(smallest_claim, claim)
+        if len(chunk) >= chunk_size:
+            chunk.sort(reverse=True)
+            runs.append(spiller.spill(chunk))
+            chunk = []
+
+    if chunk or not runs:
+        chunk.sort(reverse=True)
+        runs.append(spiller.spill(chunk))
+    return runs, claimant_count, total, smallest_claim
+
+
+def _merge_runs(runs: list[str], spiller: _RunSpiller) -> list[str]:
+    """Merges runs until no more than `_MAX_MERGE_FAN_IN` remain, removing the merged run files."""
+    while len(runs) > _MAX_MERGE_FAN_IN:
+        merged = []
+        for start in range(0, len(runs), _MAX_MERGE_FAN_IN):
+            group = runs[start : start + _MAX_MERGE_FAN_IN]
+            merged.append(spiller.spill(heapq.merge(*map(spiller.read, group), reverse=True)))
+            for path in group:
+                os.remove(path)
+        runs = merged
+    return runs
+
+
+def resolve_out_of_core(
+    claims: Iterable,
+    results_path: str,
+    memory_budget: int = DEFAULT_MEMORY_BUDGET,
+    temp_dir: Optional[str] = None,
+) -> int:
+    """
+    Resolves a dispute larger than memory, writing the allocations to a results file.
+
+    Args:
+        claims (Iterable): The claims of the dispute, e.g. streamed from a 'ClaimsReader' or parsed from disk.
+        results_path (str): Path of the results file (see 'binary_format') holding the allocations,
+            in descending order of claims.
+        memory_budget (int): Approximate number of bytes of claims held in memory at once. It also bounds the
+            read buffers of the runs being merged, and the allocations are streamed to the results file.
+        temp_dir (Optional[str]): Directory in which sorted runs are spilled; defaults to the system temp directory.
+
+    Returns:
+        int: The number of claimants in the dispute.
+
+    Raises:
+        TypeError: If a claim cannot be converted to a DisputeFraction.
+        FractionRangeError: If a claim is not within the range [0, 1].
+    """
+    chunk_size = max(1, memory_budget // _CLAIM_FOOTPRINT)
+
+    with tempfile.TemporaryDirectory(prefix="dispute-", dir=temp_dir) as spill_directory:
+        spiller = _RunSpiller(spill_directory, _block_size(memory_budget))
+        runs, claimant_count, total, smallest_claim = _sort_into_runs(claims, chunk_size, spiller)
+        runs = _merge_runs(runs, spiller)
+        logger.info("Sorted %d claims into %d spilled runs.", claimant_count, spiller.spilled)
+
+        merged_claims = heapq.merge(*map(spiller.read, runs), reverse=True)
+
+        with ResultsWriter(results_path, [0, claimant_count]) as results:
+            if not is_disputed([total]):
+                for index, claim in enumerate(merged_claims):
+                    results.set_allocation(index, claim)
+            else:
+                # The final merge streams the rounds, spilling their running sums and returning the totals.
+                rounds = spiller.next_path()
+                _, full_total = _write_rounds(rounds, merged_claims, claimant_count, spiller.block_size)
+                share_of_remainder = remainder_share(claimant_count, smallest_claim)
+
+                # Each claimant collects its partial shares, the later full shares and the remainder share.
+                running_sums = spiller.read(rounds)
+                for index, (partial_shares, full_shares) in enumerate(zip(running_sums, running_sums)):
+                    later_full_shares = full_total - full_shares
+                    results.set_allocation(index, later_full_shares + partial_shares + share_of_remainder)
+
+    logger.info("Resolved %d claims out of core.", claimant_count)
+    return claimant_count
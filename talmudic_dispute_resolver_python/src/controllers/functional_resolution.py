@@ -0,0 +1,125 @@
+"""
+Module: functional_resolution.py
+
+Description:
+- This module provides a purely functional resolution core: claims go in as an immutable tuple and a frozen,
+  slotted 'Resolution' comes out. Unlike the 'Dispute' pipeline, which mutates the 'Talit' remainder and the
+  claimants' 'collected' and 'concession' attributes round by round, nothing here is shared or mutated
+  between calls, so resolutions can run concurrently from any number of threads without a lock.
+
+Classes:
+    Resolution: The immutable result of resolving a dispute.
+
+Functions:
+    resolve: Resolves a dispute from a tuple of claims, optionally under a precision policy.
+    resolve_concurrently: Resolves many disputes on a thread pool.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from fractions import Fraction
+from typing import Iterable, Optional
+
+from ..models.dispute_fraction import validate_claim
+from ..exceptions.fraction_error import FractionPrecisionError
+from ..controllers.concession_rounds import is_disputed, iter_round_shares, remainder_share
+from ..controllers.precision import (
+    PrecisionAction,
+    PrecisionPolicy,
+    PrecisionReport,
+    bit_length,
+    decimal_allocations,
+    scaled_allocations,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class Resolution:
+    """
+    The immutable result of resolving a dispute.
+
+    Attributes:
+        claims (tuple[Fraction, ...]): The claims of the dispute, in their original order.
+        allocations (tuple[Fraction, ...]): The allocation of each claim, in the same order.
+        disputed (bool): False when the claims sum to at most 1, in which case every claim is granted in full.
+        precision (PrecisionReport): Whether the allocations are exact, or the bounded-precision fallback used.
+    """
+
+    claims: tuple[Fraction, ...]
+    allocations: tuple[Fraction, ...]
+    disputed: bool
+    precision: PrecisionReport
+
+    @property
+    def total(self) -> Fraction:
+        """The total fraction of the resource allocated."""
+        return sum(self.allocations, Fraction(0))
+
+
+def resolve(claims: tuple, precision: Optional[PrecisionPolicy] = None) -> Resolution:
+    """
+    Resolves a dispute without any shared or mutable state.
+
+    Args:
+        claims (tuple): The claims of the dispute; any other iterable is copied into a tuple first.
+        precision (Optional[PrecisionPolicy]): Bit budget of the running shares of each round, and the action
+            taken once it is exceeded. Without a policy, the dispute is always resolved exactly.
+
+    Returns:
+        Resolution: The frozen claims and allocations, in the original order of the claims.
+
+    Raises:
+        TypeError: If a claim cannot be converted to a DisputeFraction.
+        FractionRangeError: If a claim is not within the range [0, 1].
+        FractionPrecisionError: If the policy's budget is exceeded and its action is RAISE.
+    """
+    claims = tuple(Fraction(validate_claim(claim)) for claim in claims)
+
+    if not is_disputed(claims):
+        max_bits = max(map(bit_length, claims), default=0)
+        return Resolution(claims, claims, False, PrecisionReport(PrecisionAction.EXACT, max_bits))
+
+    claimant_count = len(claims)
+    order = sorted(range(claimant_count), key=claims.__getitem__, reverse=True)
+    sorted_claims = [claims[index] for index in order]
+
+    rounds, max_bits = [], 0
+    for round, shares in enumerate(iter_round_shares(sorted_claims, claimant_count)):
+        rounds.append(shares)
+        max_bits = max(max_bits, bit_length(shares[0]), bit_length(shares[1]))
+        if precision is not None and max_bits > precision.bit_budget:
+            if precision.action is PrecisionAction.RAISE:
+                raise FractionPrecisionError(max(shares, key=bit_length), precision.bit_budget, round)
+            if precision.action is PrecisionAction.SCALED_INTEGER:
+                sorted_allocations, error_bound = scaled_allocations(sorted_claims, precision.scaled_bits)
+            else:
+                sorted_allocations, error_bound = decimal_allocations(sorted_claims, precision.decimal_digits)
+            report = PrecisionReport(precision.action, max_bits, round, error_bound)
+            break
+    else:
+        full_total = rounds[-1][1]
+        share_of_remainder = remainder_share(claimant_count, sorted_claims[-1])
+        sorted_allocations = [
+            full_total - full_shares + partial_shares + share_of_remainder for partial_shares, full_shares in rounds
+        ]
+        report = PrecisionReport(PrecisionAction.EXACT, max_bits)
+
+    allocations = [Fraction(0)] * claimant_count
+    for index, allocation in zip(order, sorted_allocations):
+        allocations[index] = allocation
+    return Resolution(claims, tuple(allocations), True, report)
+
+
+def resolve_concurrently(disputes: Iterable[tuple], max_workers: Optional[int] = None) -> list[Resolution]:
+    """
+    Resolves many disputes on a thread pool.
+
+    Args:
+        disputes (Iterable[tuple]): The claims of each dispute.
+        max_workers (Optional[int]): Number of threads; defaults to the 'ThreadPoolExecutor' default.
+
+    Returns:
+        list[Resolution]: The resolution of each dispute, in order.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(resolve, disputes))
@@ -0,0 +1,109 @@
+"""
+Module: portfolio_resolution.py
+
+Description:
+- This module resolves a single set of claimants over many disputed resources at once, from a claimants x resources
+  matrix of claims, without building a 'Talit', 'ClaimantManager' and 'Dispute' per resource.
+- The round structure only depends on the number of claimants: round i distributes a partial share of
+  `(claim[i - 1] - claim[i]) / ((n - 1) * (i + 1))` and a full share of `n + 1` times as much. These per-round
+  weights are computed once for the whole portfolio, and every resource is resolved with whole-column operations.
+- Claimants' rankings are mostly stable across resources, so the sort permutation is shared: a column is only
+  re-sorted when its claims are out of order under the current permutation, which then becomes the shared one.
+
+Classes:
+    PortfolioResolution: The allocation matrix and per-claimant totals of a portfolio.
+
+Functions:
+    resolve_portfolio: Resolves every resource of a claims matrix.
+"""
+
+from dataclasses import dataclass
+from fractions import Fraction
+from itertools import accumulate, pairwise
+from operator import mul, sub
+from typing import Sequence
+
+from ..models.dispute_fraction import validate_claim
+from ..controllers.concession_rounds import is_disputed, remainder_share
+
+
+@dataclass
+class PortfolioResolution:
+    """
+    The resolution of a portfolio of disputed resources.
+
+    Attributes:
+        allocations (list[list[Fraction]]): allocations[claimant][resource] is the fraction of the resource
+            collected by the claimant, in the order of the claims matrix.
+        totals (list[Fraction]): The total collected by each claimant over all resources.
+        resorted_columns (int): Number of resources whose claims had to be sorted again.
+    """
+
+    allocations: list[list[Fraction]]
+    totals: list[Fraction]
+    resorted_columns: int
+
+
+def _resolve_column(
+    column: list[Fraction], order: list[int], partial_weights: list[Fraction]
+) -> list[Fraction]:
+    """Resolves one disputed resource, with `order` sorting its claims from largest to smallest."""
+    claimant_count = len(column)
+    sorted_claims = [column[index] for index in order]
+
+    gaps = map(sub, [Fraction(1)] + sorted_claims[:-1], sorted_claims)
+    partial_shares = list(accumulate(map(mul, gaps, partial_weights)))
+    # Full shares are `n + 1` times the partial shares, so the later full shares follow from the partial ones.
+    base = (claimant_count + 1) * partial_shares[-1] + remainder_share(claimant_count, sorted_claims[-1])
+
+    allocations = [Fraction(0)] * claimant_count
+    for index, partial_share in zip(order, partial_shares):
+        allocations[index] = base - claimant_count * partial_share
+    return allocations
+
+
+def resolve_portfolio(claims: Sequence[Sequence]) -> PortfolioResolution:
+    """
+    Resolves every resource of a claims matrix.
+
+    Args:
+        claims (Sequence[Sequence]): claims[claimant][resource] is the claim of the claimant on the resource.
+
+    Returns:
+        PortfolioResolution: The allocation matrix and the per-claimant totals.
+
+    Raises:
+        ValueError: If the rows of the matrix have different lengths.
+        TypeError: If a claim cannot be converted to a DisputeFraction.
+        FractionRangeError: If a claim is not within the range [0, 1].
+    """
+    claimant_count = len(claims)
+    resource_count = len(claims[0]) if claims else 0
+    if any(len(row) != resource_count for row in claims):
+        raise ValueError("Every claimant must have exactly one claim on each resource.")
+
+    columns = [
+        [Fraction(validate_claim(row[resource])) for row in claims] for resource in range(resource_count)
+    ]
+    # Per-round weights of the partial shares, shared by every resource. A lone claimant is never disputed.
+    partial_weights = [
+        Fraction(1, (claimant_count - 1) * (index + 1)) for index in range(claimant_count)
+    ] if claimant_count > 1 else []
+
+    order, resorted_columns = None, 0
+    resolved_columns = []
+    for column in columns:
+        if not is_disputed(column):
+            resolved_columns.append(column)
+            continue
+
+        if order is None:
+            order = sorted(range(claimant_count), key=column.__getitem__, reverse=True)
+        elif any(column[first] < column[second] for first, second in pairwise(order)):
+            order = sorted(range(claimant_count), key=column.__getitem__, reverse=True)
+            resorted_columns += 1
+        resolved_columns.append(_resolve_column(column, order, partial_weights))
+
+    allocations = [list(row) for row in zip(*resolved_columns)] if resolved_columns else [[] for _ in claims]
+    totals = [sum(row, Fraction(0)) for row in allocations]
+    return PortfolioResolution(allocations, totals, resorted_columns)
@@ -0,0 +1,149 @@
+"""
+Module: precision.py
+
+Description:
+- This module bounds the cost of exact rational arithmetic on pathological disputes. With claims such as 997/1009
+  and 1013/1019, the denominators of the running shares grow with the least common multiple of every claim's
+  denominator, to thousands of bits, and a single dispute can stall a worker for seconds.
+- A 'PrecisionPolicy' sets a bit budget for the running shares of each round and the action taken once the budget
+  is exceeded: raise a 'FractionPrecisionError', or resolve the dispute again in scaled-integer or decimal
+  arithmetic, with a guaranteed bound on the error of every allocation.
+
+Bounded-precision arithmetic:
+    Both fallbacks compute the closed form of the allocations, `(n + 1) * P - n * P_i + r`, where `P_i` is the sum
+    of the partial shares of rounds 0..i, `P` their total (full shares are `n + 1` times the partial shares),
+    and `r` the remainder share. Each partial share carries at most 3 rounding errors of one unit and each
+    running sum one more, so an allocation is off by less than `8n^2 + 4n + 4` units.
+
+Classes:
+    PrecisionAction: What a resolution did about precision.
+    PrecisionPolicy: The bit budget and the action taken once it is exceeded.
+    PrecisionReport: The precision outcome reported with a resolution.
+
+Functions:
+    bit_length: The number of bits of the larger of the numerator and denominator of a fraction.
+    scaled_allocations: Resolves sorted claims in fixed-point integer arithmetic.
+    decimal_allocations: Resolves sorted claims in decimal arithmetic.
+"""
+
+from dataclasses import dataclass
+from decimal import Decimal, localcontext
+from enum import Enum
+from fractions import Fraction
+from typing import Optional
+
+
+class PrecisionAction(Enum):
+    EXACT = "exact"
+    RAISE = "raise"
+    SCALED_INTEGER = "scaled_integer"
+    DECIMAL = "decimal"
+
+
+@dataclass(frozen=True)
+class PrecisionPolicy:
+    """
+    The bit budget of a resolution, and the action taken once it is exceeded.
+
+    Attributes:
+        bit_budget (int): The largest number of bits allowed in the running shares of a round.
+        action (PrecisionAction): RAISE, SCALED_INTEGER or DECIMAL.
+        scaled_bits (int): Fixed-point fraction bits of the scaled-integer mode.
+        decimal_digits (int): Significant digits of the decimal mode.
+    """
+
+    bit_budget: int = 4096
+    action: PrecisionAction = PrecisionAction.RAISE
+    scaled_bits: int = 256
+    decimal_digits: int = 80
+
+    def __post_init__(self) -> None:
+        if self.action is PrecisionAction.EXACT:
+            raise ValueError("A precision policy must act once its budget is exceeded.")
+
+
+@dataclass(frozen=True, slots=True)
+class PrecisionReport:
+    """
+    The precision outcome of a resolution.
+
+    Attributes:
+        action (PrecisionAction): EXACT if the budget was never exceeded, otherwise the fallback used.
+        max_bits (int): The largest bit length of the running shares computed exactly.
+        exceeded_round (Optional[int]): The round in which the budget was exceeded, if it was.
+        error_bound (Fraction): Bound on the absolute error of every allocation; zero when exact.
+    """
+
+    action: PrecisionAction
+    max_bits: int
+    exceeded_round: Optional[int] = None
+    error_bound: Fraction = Fraction(0)
+
+
+def bit_length(fraction: Fraction) -> int:
+    return max(fraction.numerator.bit_length(), fraction.denominator.bit_length())
+
+
+def _error_units(claimant_count: int) -> int:
+    return 8 * claimant_count**2 + 4 * claimant_count + 4
+
+
+def scaled_allocations(claims: list[Fraction], scaled_bits: int) -> tuple[list[Fraction], Fraction]:
+    """
+    Resolves disputed claims in fixed-point arithmetic, as integers scaled by `2 ** scaled_bits`.
+
+    Args:
+        claims (list[Fraction]): The claims, sorted from largest to smallest; at least 2 and summing to more than 1.
+        scaled_bits (int): The number of fraction bits.
+
+    Returns:
+        tuple[list[Fraction], Fraction]: The allocations in sorted order, and the bound on their error.
+    """
+    scale = 1 << scaled_bits
+    claimant_count, other_claims = len(claims), len(claims) - 1
+    scaled_claims = [claim.numerator * scale // claim.denominator for claim in claims]
+
+    partial_total, partial_totals, previous_claim = 0, [], scale
+    for index, claim in enumerate(scaled_claims):
+        partial_total += (previous_claim - claim) // (other_claims * (index + 1))
+        partial_totals.append(partial_total)
+        previous_claim = claim
+
+    share_of_remainder = scale // claimant_count - (scale - scaled_claims[-1]) // other_claims
+    base = (claimant_count + 1) * partial_total + share_of_remainder
+    allocations = [Fraction(base - claimant_count * partial, scale) for partial in partial_totals]
+    return allocations, Fraction(_error_units(claimant_count), scale)
+
+
+def decimal_allocations(claims: list[Fraction], digits: int) -> tuple[list[Fraction], Fraction]:
+    """
+    Resolves disputed claims in decimal arithmetic with a fixed number of significant digits.
+
+    Every intermediate is at most `n + 1` in magnitude, so a rounding error is less than one unit of
+    `(n + 1) * 10 ** (1 - digits)`.
+
+    Args:
+        claims (list[Fraction]): The claims, sorted from largest to smallest; at least 2 and summing to more than 1.
+        digits (int): The number of significant digits.
+
+    Returns:
+        tuple[list[Fraction], Fraction]: The allocations in sorted order, and the bound on their error.
+    """
+    claimant_count, other_claims = len(claims), len(claims) - 1
+    with localcontext() as context:
+        context.prec = digits
+        decimal_claims = [Decimal(claim.numerator) / claim.denominator for claim in claims]
+
+        partial_total, partial_totals, previous_claim = Decimal(0), [], Decimal(1)
+        for index, claim in enumerate(decimal_claims):
+            partial_total += (previous_claim - claim) / (other_claims * (index + 1))
+            partial_totals.append(partial_total)
+            previous_claim = claim
+
+        share_of_remainder = Decimal(1) / claimant_count - (1 - decimal_claims[-1]) / other_claims
+        base = (claimant_count + 1) * partial_total + share_of_remainder
+        allocations = [Fraction(base - claimant_count * partial) for partial in partial_totals]
+
+    unit = Fraction(claimant_count + 1, 10 ** (digits - 1))
+    return allocations, _error_units(claimant_count) * unit
+
@@ -0,0 +1,181 @@
+"""
+Module: verification.py
+
+Description:
+- This module audits stored resolutions against the invariants of the concession algorithm, in linear time after
+  sorting the claims, instead of recomputing every dispute through the full resolution process.
+
+Invariants (claims sorted from largest to smallest, n claimants):
+    - Undisputed claims (summing to at most 1) are granted in full.
+    - Disputed allocations sum to exactly 1.
+    - Equal claims collect equal allocations, and a larger claim never collects less than a smaller one.
+    - Round i makes the claimant at position i - 1 collect exactly `n * s_i / (i + 1)` more than the claimant at
+      position i, where `s_i = (claim[i - 1] - claim[i]) / (n - 1)` is the per-claim share of the round's concession.
+      Together with the total, these differences determine every allocation uniquely.
+
+Classes:
+    AllocationDiagnosis: The outcome of verifying a single resolution.
+
+Functions:
+    verify_allocation: Verifies the allocations of a single dispute.
+    verify_allocations: Verifies a stream of resolutions across a pool of worker processes.
+"""
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from fractions import Fraction
+from itertools import islice
+import os
+from typing import Iterable, Iterator, Optional, Sequence
+
+from ..models.dispute_fraction import validate_claim
+from ..controllers.concession_rounds import is_disputed
+
+
+@dataclass
+class AllocationDiagnosis:
+    """
+    The outcome of verifying the allocations of a dispute.
+
+    Attributes:
+        valid (bool): True if every invariant holds.
+        check (Optional[str]): Name of the first violated invariant: "length", "undisputed", "equal_treatment",
+            "monotonicity", "round_share" or "total". The per-round checks run before the total, so a single
+            wrong allocation is reported at its round rather than as a wrong total.
+        round (Optional[int]): Sorted position of the first violating claimant (the round it concludes).
+        expected (Optional[Fraction]): The value the invariant requires.
+        actual (Optional[Fraction]): The value found in the allocations.
+        message (str): Human-readable description of the violation.
+    """
+
+    valid: bool
+    check: Optional[str] = None
+    round: Optional[int] = None
+    expected: Optional[Fraction] = None
+    actual: Optional[Fraction] = None
+    message: str = ""
+
+    def __bool__(self) -> bool:
+        return self.valid
+
+
+def _violation(check: str, round: Optional[int], expected, actual, message: str) -> AllocationDiagnosis:
+    return AllocationDiagnosis(False, check, round, expected, actual, message)
+
+
+def verify_allocation(claims: Sequence, allocations: Sequence) -> AllocationDiagnosis:
+    """
+    Verifies the allocations of a dispute against the invariants of the concession algorithm.
+
+    Args:
+        claims (Sequence): The claims of the dispute, in any order.
+        allocations (Sequence): The allocation of each claim, in the same order as the claims.
+
+    Returns:
+        AllocationDiagnosis: The first violated invariant, or a valid diagnosis.
+
+    Raises:
+        TypeError: If a claim cannot be converted to a DisputeFraction.
+        FractionRangeError: If a claim is not within the range [0, 1].
+    """
+    if len(claims) != len(allocations):
+        return _violation(
+            "length", None, len(claims), len(allocations), "Every claim must have exactly one allocation."
+        )
+
+    pairs = sorted(
+        ((Fraction(validate_claim(claim)), Fraction(allocation)) for claim, allocation in zip(claims, allocations)),
+        key=lambda pair: pair[0],
+        reverse=True,
+    )
+    claimant_count = len(pairs)
+
+    if not is_disputed(claim for claim, _ in pairs):
+        for position, (claim, allocation) in enumerate(pairs):
+            if allocation != claim:
+                return _violation(
+                    "undisputed", position, claim, allocation, "Undisputed claims must be granted in full."
+                )
+        return AllocationDiagnosis(True)
+
+    other_claims = claimant_count - 1
+    for position in range(1, claimant_count):
+        previous_claim, previous_allocation = pairs[position - 1]
+        claim, allocation = pairs[position]
+
+        if claim == previous_claim and allocation != previous_allocation:
+            return _violation(
+                "equal_treatment", position, previous_allocation, allocation, "Equal claims must collect equally."
+            )
+        if allocation > previous_allocation:
+            return _violation(
+                "monotonicity",
+                position,
+                previous_allocation,
+                allocation,
+                "A smaller claim must not collect more than a larger claim.",
+            )
+
+        per_claim_share = (previous_claim - claim) / other_claims
+        expected_difference = claimant_count * per_claim_share / (position + 1)
+        if previous_allocation - allocation != expected_difference:
+            return _violation(
+                "round_share",
+                position,
+                expected_difference,
+                previous_allocation - allocation,
+                f"Round {position} must separate the allocations of consecutive claims by its shares.",
+            )
+
+    # With every difference consistent, a wrong total means the allocations are all shifted by the same amount.
+    total = sum(allocation for _, allocation in pairs)
+    if total != 1:
+        return _violation("total", None, Fraction(1), total, "Allocations of a dispute must sum to 1.")
+
+    return AllocationDiagnosis(True)
+
+
+# Chunks in flight per worker process: enough to keep every worker busy while results are consumed in order.
+_CHUNKS_PER_WORKER = 4
+
+
+def _verify_chunk(resolutions: list[tuple[Sequence, Sequence]]) -> list[AllocationDiagnosis]:
+    return [verify_allocation(*resolution) for resolution in resolutions]
+
+
+def verify_allocations(
+    resolutions: Iterable[tuple[Sequence, Sequence]], max_workers: Optional[int] = None, chunksize: int = 64
+) -> Iterator[AllocationDiagnosis]:
+    """
+    Verifies a stream of resolutions across a pool of worker processes.
+
+    Resolutions are read lazily and submitted in chunks, with at most `4 * max_workers` chunks in flight, so only
+    a bounded window of resolutions and diagnoses is held in memory however long the stream is.
+
+    Args:
+        resolutions (Iterable[tuple[Sequence, Sequence]]): Pairs of claims and their allocations.
+        max_workers (Optional[int]): Number of worker processes; defaults to the number of processors.
+        chunksize (int): Number of resolutions sent to a worker at once.
+
+    Yields:
+        AllocationDiagnosis: The diagnosis of each resolution, in order.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    resolutions = iter(resolutions)
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            while True:
+                while len(pending) < _CHUNKS_PER_WORKER * max_workers:
+                    chunk = list(islice(resolutions, chunksize))
+                    if not chunk:
+                        break
+                    pending.append(executor.submit(_verify_chunk, chunk))
+                if not pending:
+                    return
+                yield from pending.popleft().result()
+        finally:
+            # A consumer that stops early does not wait for the chunks it will never read.
+            for future in pending:
+                future.cancel()
@@ -45,3 +45,20 @@ class FractionOperationError(FractionError):
 
     def __str__(self):
         return f"{super().__str__()} - Operand: {self.target}"
+
+
+class FractionPrecisionError(FractionError):
+    """
+    Exception for fractions exceeding the bit budget of a precision policy.
+    """
+
+    def __init__(self, fraction: Fraction, bit_budget: int, round: int):
+        self.bits = max(fraction.numerator.bit_length(), fraction.denominator.bit_length())
+        message = f"Fraction of {self.bits} bits exceeds the budget of {bit_budget} bits in round {round}."
+        super().__init__(fraction, message)
+        self.bit_budget = bit_budget
+        self.round = round
+
+    def __str__(self):
+        # The fraction itself is thousands of digits long; its size is reported in the message instead.
+        return ValueError.__str__(self)
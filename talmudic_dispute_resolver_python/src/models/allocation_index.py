@@ -0,0 +1,168 @@
+"""
+Module: allocation_index.py
+
+Description:
+- Defines the 'AllocationIndex' class, a precomputed, read-only index answering point queries for the allocation
+  of a single claimant in O(log n), without materialising a 'TalitClaimant' for every party to the dispute.
+- The index is built once per dispute from the sorted claims and the prefix arrays of the per-round shares.
+  It can be saved in the columnar layout of 'binary_format' and opened by any number of reader processes,
+  which memory-map the file and share its pages instead of parsing and copying it.
+
+Dependencies:
+- Utilizes 'compute_concession_rounds' to compute the per-round shares, and the DisputeFraction class
+  (aliased as Fraction) for the returned allocations.
+"""
+
+from bisect import bisect_left
+from fractions import Fraction as _Fraction
+from operator import neg
+from typing import Union
+
+from ..models.dispute_fraction import DisputeFraction as Fraction, validate_claim
+from ..controllers.concession_rounds import ConcessionRounds, compute_concession_rounds
+from ..storage.binary_format import ColumnarReader, write_columnar
+
+
+INDEX_MAGIC = b"TDRI"
+
+# Groups of an index file, in order. The format only stores non-negative values, so the last group holds the
+# magnitude of the remainder share and its sign (1 if negative), and is empty when the claims are not disputed.
+_CLAIMS, _PARTIAL_SHARES, _FULL_SHARES, _REMAINDER_SHARE = range(4)
+
+
+class _IndexReader(ColumnarReader):
+    magic = INDEX_MAGIC
+
+
+class _MappedColumn:
+    """Read-only sequence of the fractions of one group of a memory-mapped index file."""
+
+    def __init__(self, reader: _IndexReader, group: int) -> None:
+        self._reader = reader
+        self._start = reader.offsets[group]
+        self._length = reader.offsets[group + 1] - self._start
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, position: int) -> _Fraction:
+        if position < 0:
+            position += self._length
+        if not 0 <= position < self._length:
+            raise IndexError(f"Position {position} out of range.")
+        return _Fraction(*self._reader.pair(self._start + position))
+
+
+class AllocationIndex:
+    """
+    Read-only index of the final allocations of a dispute.
+
+    Claimants can be looked up either by claim, using a binary search over the sorted claims, or by identifier,
+    where identifiers follow the numbering of 'ClaimantManager' (the claimant with the n-th largest claim is "n").
+
+    Methods:
+        build(claims: list[Fraction]) -> AllocationIndex:
+            Computes the concession rounds of a dispute and builds its index.
+
+        allocation_for(key: Union[str, Fraction]) -> Fraction:
+            Returns the allocation of the claimant with the given identifier or claim.
+
+        save(path: str) -> None / open(path: str) -> AllocationIndex:
+            Saves the index to a file, and opens a saved index without loading it into memory.
+
+    Example:
+        >>> index = AllocationIndex.build([Fraction(1), Fraction(1, 2)])
+        >>> print(index.allocation_for(Fraction(1, 2)))
+        1/4
+    """
+
+    def __init__(self, rounds: ConcessionRounds, reader: _IndexReader = None) -> None:
+        self._rounds = rounds
+        self._reader = reader
+
+    @classmethod
+    def build(cls, claims: list[Fraction]) -> "AllocationIndex":
+        return cls(compute_concession_rounds(claims))
+
+    def __len__(self) -> int:
+        return len(self._rounds.claims)
+
+    def position_of(self, key: Union[str, Fraction]) -> int:
+        """
+        Returns the sorted position of the claimant with the given identifier or claim.
+
+        Args:
+            key (Union[str, Fraction]): A claimant identifier, or the claim of the claimant.
+
+        Raises:
+            KeyError: If no claimant in the dispute matches the key.
+        """
+        claims = self._rounds.claims
+        if isinstance(key, str):
+            if not key.isdigit() or not 1 <= int(key) <= len(claims):
+                raise KeyError(f"No claimant with identifier {key!r}.")
+            return int(key) - 1
+
+        claim = validate_claim(key)
+        # Claims are sorted in descending order, so the search is done over their negations.
+        position = bisect_left(claims, -claim, key=neg)
+        if position == len(claims) or claims[position] != claim:
+            raise KeyError(f"No claimant with claim {claim}.")
+        return position
+
+    def allocation_for(self, key: Union[str, Fraction]) -> Fraction:
+        """
+        Returns the final allocation of a single claimant.
+
+        Equal claims always receive equal allocations, so any claimant holding a given claim can answer for it.
+
+        Args:
+            key (Union[str, Fraction]): A claimant identifier, or the claim of the claimant.
+
+        Returns:
+            Fraction: The fraction of the disputed resource collected by the claimant.
+
+        Raises:
+            KeyError: If no claimant in the dispute matches the key.
+        """
+        allocation = self._rounds.allocation(self.position_of(key))
+        return Fraction(allocation.numerator, allocation.denominator)
+
+    def save(self, path: str) -> None:
+        """Saves the index to a file in the columnar layout of 'binary_format'."""
+        rounds = self._rounds
+        share_of_remainder = rounds.remainder_share
+        remainder = [abs(share_of_remainder), _Fraction(share_of_remainder < 0)] if rounds.disputed else []
+        write_columnar(
+            path, INDEX_MAGIC, [list(rounds.claims), list(rounds.partial_shares), list(rounds.full_shares), remainder]
+        )
+
+    @classmethod
+    def open(cls, path: str) -> "AllocationIndex":
+        """
+        Opens an index saved with `save`, memory-mapping the file rather than reading it.
+
+        Opening decodes only the remainder share; a query decodes the entries its binary search touches.
+
+        Raises:
+            ValueError: If the file is not an index of a supported format version.
+        """
+        reader = _IndexReader(path)
+        claims, partial_shares, full_shares, remainder = (_MappedColumn(reader, group) for group in range(4))
+        disputed = len(remainder) == 2
+        share_of_remainder = _Fraction(0)
+        if disputed:
+            share_of_remainder = -remainder[0] if remainder[1] else remainder[0]
+        return cls(ConcessionRounds(claims, partial_shares, full_shares, share_of_remainder, disputed), reader)
+
+    def close(self) -> None:
+        """Releases the file of an opened index."""
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
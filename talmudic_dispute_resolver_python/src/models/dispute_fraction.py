@@ -107,5 +107,3 @@ def validate_claim(claim) -> DisputeFraction:
     if isinstance(claim, DisputeFraction):
         return claim
     return DisputeFraction(claim.numerator, claim.denominator)
-
-print(Fraction(1, 2) + Fraction(1, 2))
\ No newline at end of file
@@ -0,0 +1,339 @@
+"""
+Module: binary_format.py
+
+Description:
+- This module defines a compact, versioned, columnar binary format for bulk dispute claims and their resolutions,
+  so that batch jobs do not pay for building and formatting Python objects on the way in and out.
+- Readers memory-map the file and expose the columns as 'memoryview' objects without copying them, and the results
+  writer memory-maps a pre-sized file so that allocations are written straight into their final location.
+
+Layout (all integers little-endian):
+    header        magic (4 bytes), version (u16), reserved (u16), dispute count (u64), claim count (u64),
+                  overflow section size (u64)
+    offsets       u64[dispute count + 1]; the claims of dispute i are at [offsets[i], offsets[i + 1])
+    numerators    u64[claim count]
+    denominators  u64[claim count]
+    overflow      (varint numerator, varint denominator) for every value that does not fit in a u64; its denominator
+                  column holds the OVERFLOW sentinel, and its numerator column the byte offset of its record in
+                  this section, so that any single value is decoded without scanning the section
+
+    Claims files use the magic b"TDRC"; results files use b"TDRR" and hold one allocation per claim,
+    in the same order as the claims they resolve. Other modules store their own columns in the same layout
+    under their own magic (see 'write_columnar' and 'ColumnarReader').
+
+Functions:
+    write_columnar: Writes groups of fractions to a file of the given magic.
+    write_claims: Writes a batch of disputes to a claims file.
+    resolve_claims_file: Resolves every dispute of a claims file into a results file.
+
+Classes:
+    ColumnarReader: Zero-copy reader of the layout, subclassed with the magic of each kind of file.
+    ClaimsReader / ResultsReader: Zero-copy readers for claims and results files.
+    ResultsWriter: Writes allocations into a pre-sized results file.
+"""
+
+from array import array
+import mmap
+import os
+import shutil
+import struct
+import sys
+import tempfile
+from fractions import Fraction as _Fraction
+from typing import Iterable, Sequence
+
+from ..models.dispute_fraction import DisputeFraction as Fraction
+from ..controllers.concession_rounds import compute_concession_rounds
+from ..storage.varint import read_varint, write_varint
+
+
+CLAIMS_MAGIC = b"TDRC"
+RESULTS_MAGIC = b"TDRR"
+FORMAT_VERSION = 2
+OVERFLOW = 2**64 - 1
+
+_HEADER = struct.Struct("<4sHHQQQ")
+_WORD = 8
+
+
+def _to_words(values: Sequence[int]) -> bytes:
+    words = array("Q", values)
+    if sys.byteorder != "little":
+        words.byteswap()
+    return words.tobytes()
+
+
+def _layout(dispute_count: int, claim_count: int) -> tuple[int, int, int, int]:
+    """Returns the byte offsets of the offsets, numerators, denominators and overflow sections."""
+    offsets_start = _HEADER.size
+    numerators_start = offsets_start + (dispute_count + 1) * _WORD
+    denominators_start = numerators_start + claim_count * _WORD
+    overflow_start = denominators_start + claim_count * _WORD
+    return offsets_start, numerators_start, denominators_start, overflow_start
+
+
+def _overflows(numerator: int, denominator: int) -> bool:
+    if numerator < 0:
+        raise ValueError(f"Cannot encode negative fraction {numerator}/{denominator}.")
+    return numerator >= OVERFLOW or denominator >= OVERFLOW
+
+
+def _encode_fractions(fractions: Iterable[_Fraction]) -> tuple[list[int], list[int], bytearray]:
+    numerators, denominators, overflow = [], [], bytearray()
+    for fraction in fractions:
+        if _overflows(fraction.numerator, fraction.denominator):
+            numerators.append(len(overflow))
+            denominators.append(OVERFLOW)
+            overflow += write_varint(fraction.numerator) + write_varint(fraction.denominator)
+        else:
+            numerators.append(fraction.numerator)
+            denominators.append(fraction.denominator)
+    return numerators, denominators, overflow
+
+
+def write_columnar(path: str, magic: bytes, groups: Sequence[Sequence[_Fraction]]) -> None:
+    """
+    Writes groups of fractions to a file in the columnar layout.
+
+    Args:
+        path (str): Destination file path.
+        magic (bytes): The 4-byte magic identifying the kind of file.
+        groups (Sequence[Sequence[Fraction]]): The fractions of each group (e.g. the claims of each dispute).
+    """
+    offsets = [0]
+    for fractions in groups:
+        offsets.append(offsets[-1] + len(fractions))
+    numerators, denominators, overflow = _encode_fractions(
+        fraction for fractions in groups for fraction in fractions
+    )
+
+    with open(path, "wb") as file:
+        file.write(_HEADER.pack(magic, FORMAT_VERSION, 0, len(groups), offsets[-1], len(overflow)))
+        file.write(_to_words(offsets))
+        file.write(_to_words(numerators))
+        file.write(_to_words(denominators))
+        file.write(overflow)
+
+
+def write_claims(path: str, disputes: Sequence[Sequence[Fraction]]) -> None:
+    """
+    Writes a batch of disputes to a claims file.
+
+    Args:
+        path (str): Destination file path.
+        disputes (Sequence[Sequence[Fraction]]): The claims of each dispute.
+    """
+    write_columnar(path, CLAIMS_MAGIC, disputes)
+
+
+class ColumnarReader:
+    """
+    Memory-mapped reader of the columnar layout; subclasses set the `magic` of the files they read.
+
+    Attributes:
+        dispute_count (int): Number of disputes in the file.
+        claim_count (int): Total number of claims (or allocations) in the file.
+        offsets (memoryview): u64 column of dispute offsets.
+        numerators (memoryview): u64 column of numerators.
+        denominators (memoryview): u64 column of denominators.
+    """
+
+    magic = b""
+
+    def __init__(self, path: str) -> None:
+        self._file = open(path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+
+        magic, version, _, self.dispute_count, self.claim_count, overflow_size = _HEADER.unpack_from(self._view)
+        if magic != self.magic:
+            self.close()
+            raise ValueError(f"Not a {self.magic.decode()} file: {path}")
+        if version != FORMAT_VERSION:
+            self.close()
+            raise ValueError(f"Unsupported format version {version}: {path}")
+
+        sections = _layout(self.dispute_count, self.claim_count)
+        self.offsets = self._column(sections[0], sections[1])
+        self.numerators = self._column(sections[1], sections[2])
+        self.denominators = self._column(sections[2], sections[3])
+        self._overflow_view = self._view[sections[3] : sections[3] + overflow_size]
+
+    def _column(self, start: int, stop: int):
+        if sys.byteorder == "little":
+            return self._view[start:stop].cast("Q")
+        words = array("Q", self._view[start:stop])  # Big-endian hosts have to pay for a copy.
+        words.byteswap()
+        return memoryview(words)
+
+    def pair(self, index: int) -> tuple[int, int]:
+        """Returns the numerator and denominator stored at a flat index, decoding only its own overflow record."""
+        numerator, denominator = self.numerators[index], self.denominators[index]
+        if denominator == OVERFLOW:
+            numerator, position = read_varint(self._overflow_view, numerator)
+            denominator, _ = read_varint(self._overflow_view, position)
+        return numerator, denominator
+
+    def fraction(self, index: int) -> Fraction:
+        """Returns the fraction stored at a flat claim index."""
+        return Fraction(*self.pair(index))
+
+    def __len__(self) -> int:
+        return self.dispute_count
+
+    def __getitem__(self, dispute: int) -> list[Fraction]:
+        """Returns the fractions of a single dispute."""
+        if not 0 <= dispute < self.dispute_count:
+            raise IndexError(f"Dispute index {dispute} out of range.")
+        return [self.fraction(index) for index in range(self.offsets[dispute], self.offsets[dispute + 1])]
+
+    def close(self) -> None:
+        for name in ("offsets", "numerators", "denominators", "_overflow_view"):
+            view = self.__dict__.pop(name, None)
+            if view is not None:
+                view.release()
+        self._view.release()
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class ClaimsReader(ColumnarReader):
+    """Zero-copy reader of a claims file; indexing yields the claims of a dispute."""
+
+    magic = CLAIMS_MAGIC
+
+
+class ResultsReader(ColumnarReader):
+    """Zero-copy reader of a results file; indexing yields the allocations of a dispute."""
+
+    magic = RESULTS_MAGIC
+
+
+class ResultsWriter:
+    """
+    Writes allocations into a pre-sized, memory-mapped results file.
+
+    The file is sized from the dispute offsets up front, so each allocation is written directly into its column.
+    Values that do not fit in a u64 are streamed to a side file as they are set, with their offset written into
+    the numerator column, and the side file is appended as the overflow section on `close`; memory use does not
+    grow with the number of overflowing values. Setting an overflowing allocation twice leaves its first record
+    unreferenced in the section.
+    The file is written under a temporary name next to `path`, and only moved to `path` once it is complete;
+    leaving a `with` block on an exception discards it.
+
+    Methods:
+        set_allocation(index: int, allocation: Fraction) -> None: Writes the allocation at a flat claim index.
+        write_dispute(dispute: int, allocations: Sequence[Fraction]) -> None: Writes all allocations of a dispute.
+        close() -> None: Appends the overflow section, finalises the header and moves the file to `path`.
+        abort() -> None: Discards the file.
+    """
+
+    def __init__(self, path: str, offsets: Sequence[int]) -> None:
+        self.offsets = list(offsets)
+        self.dispute_count = len(self.offsets) - 1
+        self.claim_count = self.offsets[-1]
+        _, self._numerators_start, self._denominators_start, self._overflow_start = _layout(
+            self.dispute_count, self.claim_count
+        )
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        descriptor, self._temporary_path = tempfile.mkstemp(dir=directory, prefix=".results-")
+        self._file = os.fdopen(descriptor, "w+b")
+        self._overflow_file = tempfile.TemporaryFile(dir=directory, prefix=".overflow-")
+        self._overflow_size = 0
+        self._file.truncate(self._overflow_start)
+        self._mmap = mmap.mmap(self._file.fileno(), self._overflow_start)
+        self._mmap[: _HEADER.size] = _HEADER.pack(RESULTS_MAGIC, FORMAT_VERSION, 0, self.dispute_count, self.claim_count, 0)
+        self._mmap[_HEADER.size : self._numerators_start] = _to_words(self.offsets)
+
+        view = memoryview(self._mmap)
+        if sys.byteorder == "little":
+            self._numerators = view[self._numerators_start : self._denominators_start].cast("Q")
+            self._denominators = view[self._denominators_start : self._overflow_start].cast("Q")
+        else:
+            self._numerators = self._denominators = None
+        view.release()
+
+    def _set_words(self, index: int, numerator: int, denominator: int) -> None:
+        if self._numerators is not None:
+            self._numerators[index] = numerator
+            self._denominators[index] = denominator
+        else:
+            struct.pack_into("<Q", self._mmap, self._numerators_start + index * _WORD, numerator)
+            struct.pack_into("<Q", self._mmap, self._denominators_start + index * _WORD, denominator)
+
+    def set_allocation(self, index: int, allocation: _Fraction) -> None:
+        numerator, denominator = allocation.numerator, allocation.denominator
+        if _overflows(numerator, denominator):
+            record = write_varint(numerator) + write_varint(denominator)
+            self._overflow_file.write(record)
+            self._set_words(index, self._overflow_size, OVERFLOW)
+            self._overflow_size += len(record)
+        else:
+            self._set_words(index, numerator, denominator)
+
+    def write_dispute(self, dispute: int, allocations: Sequence[_Fraction]) -> None:
+        start, stop = self.offsets[dispute], self.offsets[dispute + 1]
+        if len(allocations) != stop - start:
+            raise ValueError(f"Dispute {dispute} expects {stop - start} allocations, got {len(allocations)}.")
+        for index, allocation in enumerate(allocations, start):
+            self.set_allocation(index, allocation)
+
+    def _unmap(self) -> None:
+        if self._numerators is not None:
+            self._numerators.release()
+            self._denominators.release()
+        self._mmap.close()
+
+    def close(self) -> None:
+        struct.pack_into("<Q", self._mmap, _HEADER.size - _WORD, self._overflow_size)
+        self._mmap.flush()
+        self._unmap()
+        self._file.seek(self._overflow_start)
+        self._overflow_file.seek(0)
+        shutil.copyfileobj(self._overflow_file, self._file)
+        self._overflow_file.close()
+        self._file.close()
+        os.replace(self._temporary_path, self.path)
+
+    def abort(self) -> None:
+        self._unmap()
+        self._overflow_file.close()
+        self._file.close()
+        os.remove(self._temporary_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc_info) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def resolve_claims_file(claims_path: str, results_path: str) -> None:
+    """
+    Resolves every dispute of a claims file into a results file.
+
+    Allocations are written in the order of the claims they resolve.
+
+    Args:
+        claims_path (str): Path of the claims file to resolve.
+        results_path (str): Path of the results file to write.
+    """
+    with ClaimsReader(claims_path) as claims_file, ResultsWriter(results_path, claims_file.offsets) as results:
+        for dispute in range(len(claims_file)):
+            claims = claims_file[dispute]
+            allocations = compute_concession_rounds(claims).allocations()
+            order = sorted(range(len(claims)), key=claims.__getitem__, reverse=True)
+
+            start = claims_file.offsets[dispute]
+            for position, index in enumerate(order):
+                results.set_allocation(start + index, allocations[position])
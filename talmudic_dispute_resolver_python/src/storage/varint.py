@@ -0,0 +1,48 @@
+"""
+Module: varint.py
+
+Description:
+- Unsigned LEB128 varints: 7 bits per byte, least significant group first, with the high bit of every byte but the
+  last set. Small integers take a single byte and arbitrarily large ones are supported, so exact fractions are
+  stored as a varint numerator and denominator by the binary format's overflow section, the spill files of the
+  out-of-core resolution and the dispute checkpoints.
+
+Functions:
+    write_varint / read_varint: Encode and decode unsigned LEB128 integers.
+"""
+
+
+def write_varint(value: int) -> bytes:
+    """Encodes a non-negative integer as an unsigned LEB128 varint."""
+    if value < 0:
+        raise ValueError(f"Cannot encode negative value {value} as a varint.")
+    encoded = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            encoded.append(byte | 0x80)
+        else:
+            encoded.append(byte)
+            return bytes(encoded)
+
+
+def read_varint(buffer, offset: int = 0) -> tuple[int, int]:
+    """
+    Decodes an unsigned LEB128 varint.
+
+    Args:
+        buffer: A bytes-like object holding the varint.
+        offset (int): Position of the first byte of the varint.
+
+    Returns:
+        tuple[int, int]: The decoded value, and the position following the varint.
+    """
+    value, shift = 0, 0
+    while True:
+        byte = buffer[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, offset
+        shift += 7
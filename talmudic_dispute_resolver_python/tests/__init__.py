@@ -0,0 +1,10 @@
+from fractions import Fraction
+
+from src.controllers.concession_rounds import compute_concession_rounds
+
+
+def expected_allocations(claims):
+    """The allocations of `compute_concession_rounds`, mapped back to the original order of the claims."""
+    rounds = compute_concession_rounds(claims)
+    allocation_of = dict(zip(rounds.claims, rounds.allocations()))
+    return [allocation_of[Fraction(claim)] for claim in claims]
@@ -0,0 +1,78 @@
+from fractions import Fraction
+import math
+import random
+
+import pytest
+
+from resolution import apply_the_talmudic_principles, create_dispute
+from src.controllers.concession_rounds import compute_concession_rounds
+from src.models.allocation_index import AllocationIndex
+from src.models.dispute_fraction import DisputeFraction
+from src.storage import binary_format
+from src.storage.binary_format import OVERFLOW
+
+
+EXAMPLES = [
+    [DisputeFraction(1), DisputeFraction(1, 2)],
+    [DisputeFraction(1), DisputeFraction(1, 2), DisputeFraction(1, 2)],
+    [DisputeFraction(1), DisputeFraction(1), DisputeFraction(1, 2)],
+    [DisputeFraction(1), DisputeFraction(1), DisputeFraction(1, 2), DisputeFraction(1, 2)],
+    [DisputeFraction(1), DisputeFraction(1, 2), DisputeFraction(1, 2), DisputeFraction(1, 3), DisputeFraction(1, 4), DisputeFraction(1)],
+]
+
+
+@pytest.mark.parametrize("claims", EXAMPLES)
+def test_allocations_match_the_dispute_pipeline(claims):
+    index = AllocationIndex.build(claims)
+    for claimant in apply_the_talmudic_principles(create_dispute(claims)):
+        assert index.allocation_for(claimant.identifier) == claimant.collected
+        assert index.allocation_for(claimant.claim) == claimant.collected
+
+
+def test_undisputed_claims_are_granted_in_full():
+    index = AllocationIndex.build([Fraction(1, 2), Fraction(1, 4)])
+    assert index.allocation_for(Fraction(1, 4)) == Fraction(1, 4)
+    assert index.allocation_for("1") == Fraction(1, 2)
+
+
+def test_unknown_claimants_raise_key_error():
+    index = AllocationIndex.build([Fraction(1), Fraction(1, 2)])
+    for key in ("0", "3", "x", Fraction(1, 3)):
+        with pytest.raises(KeyError):
+            index.allocation_for(key)
+
+
+@pytest.mark.parametrize("claims", [
+    [Fraction(1), Fraction(1, 2), Fraction(1, 3), Fraction(997, 1009), Fraction(3**50, 3**50 + 1)],
+    [Fraction(1, 3), Fraction(1, 4)],
+])
+def test_saved_index_answers_like_the_built_index(tmp_path, claims):
+    built = AllocationIndex.build(claims)
+    built.save(tmp_path / "index.bin")
+    with AllocationIndex.open(tmp_path / "index.bin") as opened:
+        assert len(opened) == len(built)
+        for position, claim in enumerate(compute_concession_rounds(claims).claims):
+            assert opened.allocation_for(claim) == built.allocation_for(claim)
+            assert opened.allocation_for(str(position + 1)) == built.allocation_for(str(position + 1))
+
+
+def test_opened_index_decodes_only_the_entries_it_touches(tmp_path, monkeypatch):
+    generator = random.Random(0)
+    claims = [Fraction(generator.randint(1, 10**4), 10**4 + generator.randint(0, 10**3)) for _ in range(1000)]
+    built = AllocationIndex.build(claims)
+    built.save(tmp_path / "index.bin")
+
+    decoded = []
+    read_varint = binary_format.read_varint
+    monkeypatch.setattr(binary_format, "read_varint", lambda *args: decoded.append(args) or read_varint(*args))
+
+    with AllocationIndex.open(tmp_path / "index.bin") as opened:
+        # Almost every prefix share overflows a u64, so reading the section eagerly would decode thousands of records.
+        overflowing = sum(denominator == OVERFLOW for denominator in opened._reader.denominators)
+        assert overflowing > len(claims)
+        assert len(decoded) <= 2 * 2  # The magnitude and sign of the remainder share.
+
+        for claim in generator.sample(claims, 20):
+            decoded.clear()
+            assert opened.allocation_for(claim) == built.allocation_for(claim)
+            assert 0 < len(decoded) <= 2 * (3 + math.ceil(math.log2(len(claims))))
@@ -0,0 +1,44 @@
+import random
+from fractions import Fraction
+
+import pytest
+
+from src.controllers.approximate_resolution import QuantileSketch, resolve_approximately
+from src.controllers.concession_rounds import compute_concession_rounds
+
+
+def random_claims(seed, count, denominator):
+    generator = random.Random(seed)
+    return [Fraction(generator.randint(0, denominator), denominator) for _ in range(count)]
+
+
+@pytest.mark.parametrize("bucket_count", [1, 2, 6, 64])
+def test_bucket_count_is_honoured(bucket_count):
+    for seed, count in enumerate([3, 10, 100, 20000]):
+        sketch = QuantileSketch(bucket_count)
+        sketch.update(random_claims(seed, count, 10007))
+        buckets = sketch.buckets()
+        assert len(buckets) <= bucket_count
+        assert sum(bucket.count for bucket in buckets) == count
+        assert all(bucket.lowest <= bucket.highest for bucket in buckets)
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_exact_allocations_fall_within_the_bounds(seed):
+    generator = random.Random(seed)
+    claims = random_claims(seed, generator.randint(1, 300), generator.choice([7, 50, 997]))
+    resolution = resolve_approximately(claims, bucket_count=generator.randint(1, 10))
+
+    rounds = compute_concession_rounds(claims)
+    for claim, allocation in zip(rounds.claims, rounds.allocations()):
+        bucket = next(bucket for bucket in resolution if bucket.lowest_claim <= claim <= bucket.highest_claim)
+        assert bucket.lower_bound <= allocation <= bucket.upper_bound
+        assert bucket.lower_bound <= bucket.allocation <= bucket.upper_bound
+        assert abs(bucket.allocation - allocation) <= bucket.max_error
+
+
+def test_more_buckets_tighten_the_bounds():
+    claims = random_claims(0, 2000, 997)
+    coarse = max(bucket.max_error for bucket in resolve_approximately(claims, bucket_count=4))
+    fine = max(bucket.max_error for bucket in resolve_approximately(claims, bucket_count=64))
+    assert fine < coarse
@@ -0,0 +1,84 @@
+import random
+from fractions import Fraction
+
+import pytest
+
+from src.controllers.batch_resolution import BatchResolver
+from tests import expected_allocations
+
+
+TEMPLATE = [Fraction(9, 10), Fraction(4, 5), Fraction(7, 10)]
+
+
+def template_disputes(count):
+    # The varying claim is the smallest, so every dispute shares the rounds of the template.
+    return [[Fraction(index, 2 * count), *TEMPLATE][::(-1) ** index] for index in range(count)]
+
+
+def test_template_disputes_reuse_the_shared_rounds():
+    disputes = template_disputes(50)
+    resolver = BatchResolver()
+
+    assert resolver.resolve_batch(disputes) == [expected_allocations(claims) for claims in disputes]
+    statistics = resolver.statistics
+    assert (statistics.disputes, statistics.undisputed, statistics.evictions) == (50, 0, 0)
+    assert statistics.rounds_computed == len(TEMPLATE) + 50
+    assert statistics.rounds_reused == len(TEMPLATE) * 49
+    assert resolver.node_count == statistics.rounds_computed
+
+    # Resolving the same disputes again is served entirely from the trie.
+    assert resolver.resolve_batch(disputes) == [expected_allocations(claims) for claims in disputes]
+    assert resolver.statistics.rounds_computed == len(TEMPLATE) + 50
+    assert resolver.statistics.rounds_reused == len(TEMPLATE) * 49 + 4 * 50
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_random_disputes_match_the_concession_rounds(seed):
+    generator = random.Random(seed)
+    disputes = [
+        [Fraction(generator.randint(0, 8), 8) for _ in range(generator.randint(1, 6))] for _ in range(200)
+    ]
+    resolver = BatchResolver()
+    assert resolver.resolve_batch(disputes) == [expected_allocations(claims) for claims in disputes]
+    statistics = resolver.statistics
+    assert statistics.rounds_reused > 0
+    assert statistics.rounds_computed == resolver.node_count
+
+
+def test_the_node_cap_bounds_the_trie():
+    disputes = template_disputes(50)
+    resolver = BatchResolver(max_nodes=10)
+
+    for claims in disputes:
+        assert resolver.resolve(claims) == expected_allocations(claims)
+        assert resolver.node_count <= 10
+
+    statistics = resolver.statistics
+    assert statistics.evictions > 0
+    assert statistics.rounds_computed + statistics.rounds_reused == 4 * 50
+
+
+def test_disputes_larger_than_the_cap_bypass_the_trie():
+    resolver = BatchResolver(max_nodes=3)
+    small = [Fraction(1), Fraction(1, 2), Fraction(1, 3)]
+    assert resolver.resolve(small) == expected_allocations(small)
+    assert resolver.node_count == 3
+
+    large = [Fraction(index, 10) for index in range(1, 11)]
+    assert resolver.resolve(large) == expected_allocations(large)
+    assert resolver.node_count == 3
+    assert resolver.statistics.evictions == 0
+    assert resolver.statistics.rounds_computed == 3 + 10
+
+    assert resolver.resolve(small) == expected_allocations(small)
+    assert resolver.statistics.rounds_reused == 3
+
+
+def test_clear_resets_the_trie():
+    resolver = BatchResolver()
+    resolver.resolve_batch(template_disputes(5))
+    resolver.clear()
+    assert resolver.node_count == 0
+    assert resolver.statistics.disputes == 0
+    with pytest.raises(ValueError):
+        BatchResolver(max_nodes=0)
@@ -0,0 +1,114 @@
+import os
+import random
+from fractions import Fraction
+
+import pytest
+
+from src.storage import binary_format
+from src.storage.binary_format import (
+    OVERFLOW,
+    ClaimsReader,
+    ResultsReader,
+    ResultsWriter,
+    resolve_claims_file,
+    write_claims,
+)
+from src.storage.varint import read_varint, write_varint
+from tests import expected_allocations
+
+
+HUGE = Fraction(3**50, 3**50 + 1)
+
+DISPUTES = [
+    [Fraction(1), Fraction(1, 2)],
+    [],
+    [Fraction(1, 3), Fraction(1, 4)],
+    [Fraction(1), HUGE, Fraction(997, 1009), Fraction(1013, 1019)],
+]
+
+
+@pytest.mark.parametrize("value", [0, 1, 127, 128, 300, OVERFLOW, 3**200])
+def test_varint_round_trip(value):
+    encoded = write_varint(value)
+    assert read_varint(b"\x00" + encoded, 1) == (value, len(encoded) + 1)
+
+
+def test_claims_round_trip_with_overflow(tmp_path):
+    write_claims(tmp_path / "claims.bin", DISPUTES)
+    with ClaimsReader(tmp_path / "claims.bin") as reader:
+        assert len(reader) == len(DISPUTES)
+        assert list(reader.offsets) == [0, 2, 2, 4, 8]
+        assert [reader[dispute] for dispute in range(len(reader))] == DISPUTES
+        assert reader.denominators[5] == OVERFLOW
+
+
+def test_resolved_claims_file_holds_allocations_in_claim_order(tmp_path):
+    write_claims(tmp_path / "claims.bin", DISPUTES)
+    resolve_claims_file(tmp_path / "claims.bin", tmp_path / "results.bin")
+
+    with ResultsReader(tmp_path / "results.bin") as reader:
+        for dispute, claims in enumerate(DISPUTES):
+            assert reader[dispute] == expected_allocations(claims)
+
+
+def test_readers_reject_the_other_kind_of_file(tmp_path):
+    write_claims(tmp_path / "claims.bin", DISPUTES)
+    with pytest.raises(ValueError):
+        ResultsReader(tmp_path / "claims.bin")
+
+
+def test_failed_writer_leaves_no_file(tmp_path):
+    with pytest.raises(RuntimeError):
+        with ResultsWriter(tmp_path / "results.bin", [0, 2]) as writer:
+            writer.set_allocation(0, Fraction(1, 2))
+            raise RuntimeError("resolution failed")
+    assert os.listdir(tmp_path) == []
+
+
+def overflowing_disputes(seed, count):
+    """Disputes whose claims mostly have numerators and denominators beyond a u64."""
+    generator = random.Random(seed)
+    disputes = []
+    for _ in range(count):
+        denominator = generator.randint(2**64, 2**100)
+        claims = [Fraction(generator.randint(0, denominator), denominator) for _ in range(generator.randint(0, 6))]
+        claims += [Fraction(generator.randint(0, 7), 7)] * generator.randint(0, 1)
+        disputes.append(claims)
+    return disputes
+
+
+def test_round_trip_with_mostly_overflowing_values(tmp_path, monkeypatch):
+    disputes = overflowing_disputes(0, 200)
+    write_claims(tmp_path / "claims.bin", disputes)
+    resolve_claims_file(tmp_path / "claims.bin", tmp_path / "results.bin")
+
+    decoded = []
+    read_varint = binary_format.read_varint
+    monkeypatch.setattr(binary_format, "read_varint", lambda *args: decoded.append(args) or read_varint(*args))
+
+    with ClaimsReader(tmp_path / "claims.bin") as claims_file, ResultsReader(tmp_path / "results.bin") as results:
+        overflowing = sum(denominator == OVERFLOW for denominator in results.denominators)
+        assert overflowing > results.claim_count * 3 // 4
+
+        for dispute in reversed(range(len(disputes))):
+            decoded.clear()
+            claims = claims_file[dispute]
+            assert claims == disputes[dispute]
+            assert results[dispute] == expected_allocations(claims)
+            # Each value decodes its own record (a numerator and a denominator) and nothing else.
+            assert len(decoded) <= 2 * 2 * len(claims)
+
+
+def test_writer_streams_overflow_records(tmp_path):
+    values = [Fraction(3**60 + index, 3**61) for index in range(50)]
+    with ResultsWriter(tmp_path / "results.bin", [0, 50]) as writer:
+        for index, value in enumerate(values):
+            writer.set_allocation(index, value)
+        assert writer._overflow_size > 0
+        writer.set_allocation(7, Fraction(1, 3))  # Replacing an overflowing value with a small one.
+        writer.set_allocation(8, values[9])
+    values[7], values[8] = Fraction(1, 3), values[9]
+
+    with ResultsReader(tmp_path / "results.bin") as reader:
+        assert reader[0] == values
+    assert os.listdir(tmp_path) == ["results.bin"]
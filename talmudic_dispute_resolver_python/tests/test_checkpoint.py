@@ -0,0 +1,103 @@
+import pytest
+
+from resolution import apply_the_talmudic_principles, create_dispute, resume_dispute
+from src.controllers.dispute import CHECKPOINT_MAGIC, Dispute
+from src.controllers.precision import PrecisionPolicy
+from src.models.dispute_fraction import DisputeFraction as Fraction
+from src.storage.varint import write_varint
+
+
+EXAMPLES = [
+    [Fraction(1), Fraction(1, 2), Fraction(1, 2)],
+    [Fraction(1), Fraction(1), Fraction(1, 2), Fraction(1, 2)],
+    [Fraction(1), Fraction(1, 2), Fraction(1, 2), Fraction(1, 3), Fraction(1, 4), Fraction(1)],
+    [Fraction(1), Fraction(5, 6), Fraction(2, 3), Fraction(1, 2), Fraction(1, 3)],
+    [Fraction(9, 10), Fraction(4, 5), Fraction(7, 10), Fraction(3, 5)],
+    [Fraction(997, 1009), Fraction(1013, 1019), Fraction(1, 2)],
+]
+
+
+class Interrupted(Exception):
+    pass
+
+
+def final_state(claimants):
+    return [(claimant.identifier, claimant.collected) for claimant in claimants]
+
+
+def uninterrupted(claims):
+    dispute = create_dispute(claims)
+    return final_state(apply_the_talmudic_principles(dispute)), dispute.round
+
+
+def interruptions():
+    for claims in EXAMPLES:
+        _, rounds = uninterrupted(claims)
+        for round in range(1, rounds):
+            yield claims, round
+
+
+@pytest.mark.parametrize("claims, interrupted_round", list(interruptions()))
+def test_resumed_dispute_reaches_the_same_resolution(tmp_path, monkeypatch, claims, interrupted_round):
+    checkpoint_path = tmp_path / "dispute.checkpoint"
+    save_checkpoint = Dispute.save_checkpoint
+
+    def save_then_interrupt(dispute, path):
+        save_checkpoint(dispute, path)
+        if dispute.round == interrupted_round:
+            raise Interrupted
+
+    monkeypatch.setattr(Dispute, "save_checkpoint", save_then_interrupt)
+    with pytest.raises(Interrupted):
+        apply_the_talmudic_principles(create_dispute(claims), checkpoint_path, checkpoint_rounds=1)
+    monkeypatch.undo()
+
+    dispute = resume_dispute(checkpoint_path)
+    assert dispute.round == interrupted_round
+    expected, rounds = uninterrupted(claims)
+    assert final_state(apply_the_talmudic_principles(dispute)) == expected
+    assert dispute.round == rounds
+    assert [path.name for path in tmp_path.iterdir()] == [checkpoint_path.name]
+
+
+def test_checkpoint_stores_each_value_as_its_own_fraction():
+    claims = [Fraction(997, 1009), Fraction(1013, 1019), Fraction(1, 2)]
+    dispute = create_dispute(claims)
+    dispute.handle_distribution(dispute.partial_claimants[0].concession)
+    checkpoint = dispute.checkpoint()
+
+    for claim in claims:
+        assert write_varint(claim.numerator) + write_varint(claim.denominator) in checkpoint
+    restored = Dispute.from_checkpoint(checkpoint, dispute.talit.__class__(), dispute.claimant_manager)
+    assert restored.checkpoint() == checkpoint
+
+
+def test_checkpoint_rejects_other_data():
+    dispute = create_dispute(EXAMPLES[0])
+    with pytest.raises(ValueError):
+        Dispute.from_checkpoint(b"TDRC" + bytes(8), dispute.talit, dispute.claimant_manager)
+    with pytest.raises(ValueError):
+        Dispute.from_checkpoint(CHECKPOINT_MAGIC + bytes([1, 0, 0, 0]), dispute.talit, dispute.claimant_manager)
+
+
+def test_checkpoint_path_requires_an_interval(tmp_path):
+    with pytest.raises(ValueError):
+        apply_the_talmudic_principles(create_dispute(EXAMPLES[0]), tmp_path / "dispute.checkpoint")
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.parametrize("claims", EXAMPLES[-3:])
+def test_resumed_dispute_keeps_its_peak_precision(tmp_path, claims):
+    policy = PrecisionPolicy(bit_budget=4096)
+    uninterrupted_dispute = create_dispute(claims, precision=policy)
+    apply_the_talmudic_principles(uninterrupted_dispute)
+
+    dispute = create_dispute(claims, precision=policy)
+    while dispute.round < 2:
+        dispute.handle_distribution(dispute.partial_claimants[0].concession)
+    dispute.save_checkpoint(tmp_path / "dispute.checkpoint")
+
+    resumed = resume_dispute(tmp_path / "dispute.checkpoint", precision=policy)
+    assert resumed.precision_report == dispute.precision_report
+    apply_the_talmudic_principles(resumed)
+    assert resumed.precision_report == uninterrupted_dispute.precision_report
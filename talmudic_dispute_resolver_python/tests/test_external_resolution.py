@@ -0,0 +1,65 @@
+import os
+import random
+import tracemalloc
+from fractions import Fraction
+
+import pytest
+
+from src.controllers.concession_rounds import compute_concession_rounds
+from src.controllers.external_resolution import _MAX_MERGE_FAN_IN, _block_size, resolve_out_of_core
+from src.storage.binary_format import ResultsReader
+
+
+def resolve_to_list(claims, tmp_path, memory_budget):
+    results_path = tmp_path / "results.bin"
+    spill_directory = tmp_path / "spill"
+    spill_directory.mkdir()
+    claimant_count = resolve_out_of_core(iter(claims), results_path, memory_budget, spill_directory)
+    assert claimant_count == len(claims)
+    assert os.listdir(spill_directory) == []
+    with ResultsReader(results_path) as reader:
+        return reader[0]
+
+
+@pytest.mark.parametrize("claimant_count", [0, 1, 2, 7, 300])
+def test_tiny_memory_budget_forces_multi_pass_merges(tmp_path, claimant_count):
+    # A budget of a single claim spills every claim as its own run, so 300 claims need more than one merge pass.
+    generator = random.Random(claimant_count)
+    claims = [Fraction(generator.randint(0, 13), 13) for _ in range(claimant_count)]
+    assert resolve_to_list(claims, tmp_path, memory_budget=1) == compute_concession_rounds(claims).allocations()
+
+
+def test_undisputed_claims_are_granted_in_full(tmp_path):
+    claims = [Fraction(1, 5)] * 5
+    assert resolve_to_list(claims, tmp_path, memory_budget=1) == claims
+
+
+def peak_memory_and_size(claims, tmp_path, memory_budget):
+    results_path = tmp_path / f"results-{len(claims)}.bin"
+    tracemalloc.start()
+    try:
+        resolve_out_of_core(iter(claims), results_path, memory_budget, tmp_path)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak, os.path.getsize(results_path)
+
+
+def test_exact_allocations_are_streamed_to_the_results_file(tmp_path):
+    # Denominators up to a million make nearly every running sum and allocation overflow a u64.
+    generator = random.Random(0)
+    claims = [Fraction(generator.randint(1, 10**5), generator.randint(10**5, 10**6)) for _ in range(300)]
+    small_peak, small_size = peak_memory_and_size(claims[:150], tmp_path, memory_budget=20 * 256)
+    large_peak, large_size = peak_memory_and_size(claims, tmp_path, memory_budget=20 * 256)
+
+    # The results grow several times over, while the memory held at once barely does.
+    assert large_size > 3 * small_size
+    assert large_peak < small_peak * 3 // 2
+    assert large_peak < large_size
+
+
+@pytest.mark.parametrize("memory_budget", [1, 2**16, 2**26, 2**40])
+def test_merge_buffers_fit_the_memory_budget(memory_budget):
+    block_size = _block_size(memory_budget)
+    assert 0 < block_size <= max(2**12, memory_budget // _MAX_MERGE_FAN_IN)
+    assert block_size <= 2**20
@@ -0,0 +1,67 @@
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from fractions import Fraction
+
+import pytest
+
+from src.controllers.functional_resolution import Resolution, resolve, resolve_concurrently
+from src.controllers.precision import PrecisionAction
+from tests import expected_allocations
+
+
+def stress_disputes(seed, templates=60, count=3000):
+    """Disputes drawn from a small pool of claim tuples, so identical tuples are resolved concurrently."""
+    generator = random.Random(seed)
+    denominators = [2, 3, 7, 12, 97]
+    pool = [
+        tuple(
+            Fraction(generator.randint(0, denominator), denominator)
+            for denominator in generator.choices(denominators, k=generator.randint(1, 9))
+        )
+        for _ in range(templates)
+    ]
+    return [generator.choice(pool) for _ in range(count)]
+
+
+def assert_matches_serial_rounds(disputes, resolutions):
+    assert len(resolutions) == len(disputes)
+    expected = {claims: tuple(expected_allocations(claims)) for claims in set(disputes)}
+    for claims, resolution in zip(disputes, resolutions):
+        assert isinstance(resolution, Resolution)
+        assert resolution.claims == claims
+        assert resolution.allocations == expected[claims]
+        assert resolution.precision.action is PrecisionAction.EXACT
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_resolve_concurrently_matches_serial_rounds(seed):
+    disputes = stress_disputes(seed)
+    assert_matches_serial_rounds(disputes, resolve_concurrently(disputes, max_workers=16))
+
+
+def test_resolve_from_many_threads_at_once():
+    disputes = stress_disputes(3)
+    thread_count = 16
+    barrier = threading.Barrier(thread_count)
+
+    def resolve_slice(start):
+        barrier.wait()  # Start every thread together to maximise interleaving.
+        return [resolve(claims) for claims in disputes[start::thread_count]]
+
+    with ThreadPoolExecutor(max_workers=thread_count) as executor:
+        slices = list(executor.map(resolve_slice, range(thread_count)))
+
+    resolutions = [None] * len(disputes)
+    for start, resolved in enumerate(slices):
+        resolutions[start::thread_count] = resolved
+    assert_matches_serial_rounds(disputes, resolutions)
+
+    # Identical claim tuples resolve to equal, hashable resolutions.
+    assert len({resolution for resolution in resolutions}) == len(set(disputes))
+
+
+def test_undisputed_claims_are_granted_in_full():
+    resolution = resolve((Fraction(1, 2), Fraction(1, 4)))
+    assert not resolution.disputed
+    assert resolution.allocations == resolution.claims
@@ -0,0 +1,44 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+
+PACKAGE_DIRECTORY = Path(__file__).resolve().parents[1]
+
+# Importing the package only defines the table of lazy attributes; anything close to this budget means an
+# engine, or its dependencies, is imported eagerly again.
+IMPORT_BUDGET_MICROSECONDS = 50_000
+
+
+def run_python(code, working_directory, *options):
+    environment = dict(os.environ, PYTHONPATH=str(PACKAGE_DIRECTORY), PYTHONDONTWRITEBYTECODE="1")
+    return subprocess.run(
+        [sys.executable, *options, "-c", code],
+        cwd=working_directory,
+        env=environment,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def test_importing_the_package_is_cheap_and_loads_no_engine(tmp_path):
+    code = "import sys, src; print(sorted(name for name in sys.modules if name.startswith('src.')))"
+    completed = run_python(code, tmp_path, "-X", "importtime")
+
+    assert completed.stdout.strip() == "[]"
+    timings = {}
+    for line in completed.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, module = line.split("|")
+            timings[module.strip()] = cumulative.strip()
+    assert int(timings["src"]) < IMPORT_BUDGET_MICROSECONDS
+
+
+def test_importing_has_no_side_effects(tmp_path):
+    code = "import logging, src, resolution; src.Dispute; src.resolve; print(logging.getLogger().handlers)"
+    completed = run_python(code, tmp_path)
+
+    assert completed.stdout.strip() == "[]"
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,62 @@
+import random
+from fractions import Fraction
+
+import pytest
+
+from src.controllers.portfolio_resolution import resolve_portfolio
+from tests import expected_allocations
+
+
+def assert_matches_each_resource(claims, resolution):
+    for resource, column in enumerate(zip(*claims)):
+        assert [row[resource] for row in resolution.allocations] == expected_allocations(column)
+    assert resolution.totals == [sum(row, Fraction(0)) for row in resolution.allocations]
+
+
+def test_stable_rankings_share_the_sort_permutation():
+    claims = [
+        [Fraction(1), Fraction(9, 10), Fraction(1, 3), Fraction(1)],
+        [Fraction(1, 2), Fraction(1, 2), Fraction(1, 3), Fraction(3, 4)],
+        [Fraction(1, 3), Fraction(1, 5), Fraction(1, 4), Fraction(1, 3)],
+    ]
+    resolution = resolve_portfolio(claims)
+    assert resolution.resorted_columns == 0
+    assert_matches_each_resource(claims, resolution)
+
+
+def test_columns_out_of_order_are_resorted():
+    claims = [
+        [Fraction(1), Fraction(1, 4), Fraction(1), Fraction(1, 2)],
+        [Fraction(1, 2), Fraction(1), Fraction(1, 2), Fraction(1, 2)],
+        [Fraction(1, 3), Fraction(1, 2), Fraction(1, 3), Fraction(1, 2)],
+    ]
+    resolution = resolve_portfolio(claims)
+    # The second column reverses the ranking of the first two claimants, and the third restores it.
+    # The fourth only ties claims, which is still in order under the permutation of the third.
+    assert resolution.resorted_columns == 2
+    assert_matches_each_resource(claims, resolution)
+    assert resolution.totals == [
+        Fraction(11, 18) + Fraction(1, 8) + Fraction(11, 18) + Fraction(1, 3),
+        Fraction(17, 72) + Fraction(5, 8) + Fraction(17, 72) + Fraction(1, 3),
+        Fraction(11, 72) + Fraction(1, 4) + Fraction(11, 72) + Fraction(1, 3),
+    ]
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_random_portfolios_match_each_resource(seed):
+    generator = random.Random(seed)
+    claimant_count, resource_count = generator.randint(1, 7), generator.randint(1, 30)
+    claims = [[Fraction(generator.randint(0, 12), 12) for _ in range(resource_count)] for _ in range(claimant_count)]
+    assert_matches_each_resource(claims, resolve_portfolio(claims))
+
+
+def test_undisputed_resources_are_granted_in_full():
+    claims = [[Fraction(1, 2), Fraction(1)], [Fraction(1, 4), Fraction(1, 2)]]
+    resolution = resolve_portfolio(claims)
+    assert [row[0] for row in resolution.allocations] == [Fraction(1, 2), Fraction(1, 4)]
+    assert resolution.totals == [Fraction(1, 2) + Fraction(3, 4), Fraction(1, 4) + Fraction(1, 4)]
+
+
+def test_rows_must_have_the_same_length():
+    with pytest.raises(ValueError):
+        resolve_portfolio([[Fraction(1), Fraction(1)], [Fraction(1)]])
@@ -0,0 +1,126 @@
+from fractions import Fraction
+from time import perf_counter
+
+import pytest
+
+from resolution import apply_the_talmudic_principles, create_dispute
+from src.controllers.functional_resolution import resolve
+from src.controllers.precision import PrecisionAction, PrecisionPolicy
+from src.exceptions.fraction_error import FractionPrecisionError
+from src.models.dispute_fraction import DisputeFraction
+
+
+# The fallbacks are closed-form passes over the claims, measured against the exact resolution on the same machine
+# rather than a fixed wall-clock budget: they run about fifty times faster, so a tenth leaves room for noise.
+FALLBACK_SPEEDUP = 10
+
+FALLBACKS = [
+    PrecisionPolicy(action=PrecisionAction.SCALED_INTEGER),
+    PrecisionPolicy(action=PrecisionAction.DECIMAL),
+]
+
+
+def primes(count):
+    found, number = [], 900
+    while len(found) < count:
+        if all(number % divisor for divisor in range(2, int(number**0.5) + 1)):
+            found.append(number)
+        number += 1
+    return found
+
+
+@pytest.fixture(scope="module")
+def pathological_claims():
+    """Claims over distinct prime denominators, whose running shares grow to tens of thousands of bits."""
+    denominators = primes(1501)
+    return tuple(Fraction(numerator, denominator) for numerator, denominator in zip(denominators, denominators[1:]))
+
+
+def timed_resolution(claims, policy=None):
+    start = perf_counter()
+    resolution = resolve(claims, precision=policy)
+    return resolution, perf_counter() - start
+
+
+@pytest.fixture(scope="module")
+def exact_timed_resolution(pathological_claims):
+    return timed_resolution(pathological_claims)
+
+
+@pytest.fixture(scope="module")
+def exact_resolution(exact_timed_resolution):
+    return exact_timed_resolution[0]
+
+
+def test_exact_resolution_exceeds_the_default_budget(exact_resolution):
+    assert exact_resolution.precision.action is PrecisionAction.EXACT
+    assert exact_resolution.precision.max_bits > PrecisionPolicy().bit_budget
+
+
+@pytest.mark.parametrize("policy", FALLBACKS, ids=lambda policy: policy.action.value)
+def test_fallback_is_fast_and_within_its_error_bound(pathological_claims, exact_timed_resolution, policy):
+    exact_resolution, exact_seconds = exact_timed_resolution
+    resolution, seconds = timed_resolution(pathological_claims, policy)
+    assert seconds < exact_seconds / FALLBACK_SPEEDUP
+
+    report = resolution.precision
+    assert report.action is policy.action
+    assert report.exceeded_round is not None
+    assert 0 < report.error_bound < Fraction(1, 10**60)
+    for approximate, exact in zip(resolution.allocations, exact_resolution.allocations):
+        assert abs(approximate - exact) <= report.error_bound
+
+
+def test_raise_reports_the_round(pathological_claims):
+    with pytest.raises(FractionPrecisionError) as raised:
+        resolve(pathological_claims, precision=PrecisionPolicy())
+    assert raised.value.bits > raised.value.bit_budget == PrecisionPolicy().bit_budget
+
+
+CLAIMS = [DisputeFraction(1), DisputeFraction(1, 2), DisputeFraction(1, 2), DisputeFraction(1, 3), DisputeFraction(1, 4), DisputeFraction(1)]
+
+
+def collected(claimants):
+    return {claimant.identifier: Fraction(claimant.collected) for claimant in claimants}
+
+
+def test_dispute_within_budget_is_exact():
+    dispute = create_dispute(CLAIMS, precision=PrecisionPolicy(bit_budget=64))
+    exact = collected(apply_the_talmudic_principles(create_dispute(CLAIMS)))
+    assert collected(apply_the_talmudic_principles(dispute)) == exact
+    assert dispute.precision_report.action is PrecisionAction.EXACT
+    assert 0 < dispute.precision_report.max_bits <= 64
+
+
+def test_dispute_raises_once_the_budget_is_exceeded():
+    dispute = create_dispute(CLAIMS, precision=PrecisionPolicy(bit_budget=3))
+    with pytest.raises(FractionPrecisionError) as raised:
+        apply_the_talmudic_principles(dispute)
+    assert raised.value.round == dispute.round
+    # The dispute is left at the end of the round that exceeded the budget, and can still be resolved exactly.
+    dispute.precision = None
+    exact = collected(apply_the_talmudic_principles(create_dispute(CLAIMS)))
+    assert collected(apply_the_talmudic_principles(dispute)) == exact
+
+
+@pytest.mark.parametrize("action", [PrecisionAction.SCALED_INTEGER, PrecisionAction.DECIMAL])
+def test_dispute_falls_back_within_its_error_bound(action):
+    policy = PrecisionPolicy(bit_budget=3, action=action, scaled_bits=32, decimal_digits=12)
+    dispute = create_dispute(CLAIMS, precision=policy)
+    approximate = collected(apply_the_talmudic_principles(dispute))
+    exact = collected(apply_the_talmudic_principles(create_dispute(CLAIMS)))
+
+    report = dispute.precision_report
+    assert (report.action, report.exceeded_round) == (action, dispute.round)
+    assert 0 < report.error_bound < Fraction(1, 1000)
+    assert approximate.keys() == exact.keys()
+    for identifier, allocation in exact.items():
+        assert abs(approximate[identifier] - allocation) <= report.error_bound
+
+
+def test_dispute_without_a_policy_measures_nothing(monkeypatch):
+    dispute = create_dispute(CLAIMS)
+    report = dispute.precision_report
+    monkeypatch.setattr("src.controllers.dispute.bit_length", lambda fraction: pytest.fail("bit_length was called"))
+    apply_the_talmudic_principles(dispute)
+    assert dispute.precision_report is report
@@ -0,0 +1,91 @@
+import random
+from fractions import Fraction
+
+import pytest
+
+from src.controllers.concession_rounds import compute_concession_rounds
+from src.controllers.verification import verify_allocation, verify_allocations
+
+
+CLAIMS = [Fraction(1), Fraction(3, 4), Fraction(1, 2), Fraction(1, 3), Fraction(1, 4)]
+ROUND_CHECKS = {"equal_treatment", "monotonicity", "round_share"}
+
+
+def resolved(claims):
+    rounds = compute_concession_rounds(claims)
+    return list(rounds.claims), rounds.allocations()
+
+
+def random_claims(seed):
+    generator = random.Random(seed)
+    denominator = generator.choice([4, 12, 97])
+    return [Fraction(generator.randint(0, denominator), denominator) for _ in range(generator.randint(1, 12))]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_resolved_allocations_are_valid(seed):
+    claims, allocations = resolved(random_claims(seed))
+    assert verify_allocation(claims, allocations)
+    assert verify_allocation(claims[::-1], allocations[::-1])
+
+
+def test_undisputed_claims_must_be_granted_in_full():
+    claims = [Fraction(1, 2), Fraction(1, 4)]
+    assert verify_allocation(claims, claims)
+    diagnosis = verify_allocation(claims, [Fraction(1, 2), Fraction(1, 8)])
+    assert (diagnosis.check, diagnosis.round) == ("undisputed", 1)
+
+
+def test_length_mismatch():
+    assert verify_allocation(CLAIMS, [Fraction(1)]).check == "length"
+
+
+@pytest.mark.parametrize("position", range(len(CLAIMS)))
+def test_a_single_wrong_allocation_is_reported_at_its_round(position):
+    claims, allocations = resolved(CLAIMS)
+    allocations[position] += Fraction(1, 100)
+
+    diagnosis = verify_allocation(claims, allocations)
+    assert not diagnosis
+    assert diagnosis.check in ROUND_CHECKS
+    assert diagnosis.round == max(position, 1)
+
+
+def test_a_uniform_shift_is_reported_as_the_total():
+    claims, allocations = resolved(CLAIMS)
+    shift = Fraction(1, 100)
+    diagnosis = verify_allocation(claims, [allocation + shift for allocation in allocations])
+    assert (diagnosis.check, diagnosis.expected, diagnosis.actual) == ("total", 1, 1 + len(claims) * shift)
+
+
+def test_equal_claims_must_collect_equally():
+    claims, allocations = resolved([Fraction(3, 4), Fraction(3, 4), Fraction(1, 2)])
+    allocations[0] += Fraction(1, 100)
+    allocations[1] -= Fraction(1, 100)
+    assert verify_allocation(claims, allocations).check == "equal_treatment"
+
+
+def test_verify_allocations_matches_the_serial_diagnoses():
+    resolutions = [resolved(random_claims(seed)) for seed in range(10)]
+    claims, allocations = resolutions[3]
+    resolutions[3] = (claims, [Fraction(0)] * len(allocations))
+
+    diagnoses = list(verify_allocations(resolutions, max_workers=2, chunksize=3))
+    assert diagnoses == [verify_allocation(*resolution) for resolution in resolutions]
+    assert [bool(diagnosis) for diagnosis in diagnoses] == [index != 3 for index in range(10)]
+
+
+def test_verify_allocations_reads_the_stream_in_bounded_windows():
+    consumed = []
+
+    def stream():
+        for seed in range(100):
+            consumed.append(seed)
+            yield resolved(random_claims(seed))
+
+    diagnoses = verify_allocations(stream(), max_workers=1, chunksize=2)
+    assert next(diagnoses)
+    # One worker keeps at most four chunks of two resolutions in flight.
+    assert len(consumed) <= 8
+    assert all(diagnoses)
+    assert len(consumed) == 100